@@ -23,7 +23,7 @@ from .indicators import (
     count_recovery_patterns,
     find_support_resistance,
 )
-from .scoring import calculate_trade_score, calculate_investment_score, get_rating_label
+from .scoring import ScoreInputs, calculate_scores, get_rating_label
 
 
 @dataclass
@@ -121,45 +121,25 @@ def calculate_score_at_date(
     support, resistance = find_support_resistance(closes, window=5)
 
     # Calculate scores (v1.3 - returns ScoreResult)
-    trade_result = calculate_trade_score(
+    inputs = ScoreInputs.from_indicators(
         current_price=current_price,
-        macd_bias=macd.bias if macd else None,
-        macd_hist=macd.hist if macd else None,
-        rsi_value=rsi.value if rsi else None,
-        rsi_bias=rsi.bias if rsi else None,
+        macd=macd,
+        rsi=rsi,
         sma10=sma10,
         sma20=sma20,
         sma50=sma50,
         sma100=sma100,
-        trend10_bias=trend10.bias if trend10 else None,
-        trend50_bias=trend50.bias if trend50 else None,
+        trend10=trend10,
+        trend50=trend50,
         long_term_trend=long_term_trend,
-        volatility_bias=volatility.bias if volatility else None,
+        volatility=volatility,
         distance_from_high=distance_from_high,
         resilience_count=resilience_count,
         closes=closes,
         support=support,
         resistance=resistance
     )
-
-    inv_result = calculate_investment_score(
-        current_price=current_price,
-        macd_bias=macd.bias if macd else None,
-        macd_hist=macd.hist if macd else None,
-        rsi_value=rsi.value if rsi else None,
-        rsi_bias=rsi.bias if rsi else None,
-        sma10=sma10,
-        sma20=sma20,
-        sma50=sma50,
-        sma100=sma100,
-        trend10_bias=trend10.bias if trend10 else None,
-        trend50_bias=trend50.bias if trend50 else None,
-        long_term_trend=long_term_trend,
-        volatility_bias=volatility.bias if volatility else None,
-        distance_from_high=distance_from_high,
-        resilience_count=resilience_count,
-        closes=closes
-    )
+    trade_result, inv_result = calculate_scores(inputs)
 
     # Return display scores (turnaround if active, else BAU)
     return trade_result.display_score, inv_result.display_score
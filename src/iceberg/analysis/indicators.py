@@ -1,6 +1,6 @@
 """Technical analysis indicators ported from StockStreet Swift"""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import statistics
 
 from .models import (
@@ -12,6 +12,7 @@ from .models import (
     TrendBias,
     VolatilitySummary,
     VolatilityBias,
+    BenchmarkStats,
 )
 
 
@@ -30,20 +31,28 @@ def compute_ema(values: List[float], period: int) -> List[float]:
         return []
 
     k = 2 / (period + 1)
-    ema = [values[0]]  # First EMA = first value
+    k_prev = 1 - k
+    prev = values[0]
+    ema = [prev]  # First EMA = first value
+    append = ema.append
 
-    for i in range(1, len(values)):
-        ema.append(values[i] * k + ema[i - 1] * (1 - k))
+    # Carry the previous EMA in a local rather than indexing back into the list
+    for value in values[1:]:
+        prev = value * k + prev * k_prev
+        append(prev)
 
     return ema
 
 
-def compute_macd(closes: List[float]) -> Optional[MACDResult]:
+def compute_macd(
+    closes: List[float], fast_ema: Optional[List[float]] = None
+) -> Optional[MACDResult]:
     """
     Compute MACD(12,26,9) indicator
 
     Args:
         closes: Closing prices (oldest to newest)
+        fast_ema: Optional precomputed compute_ema(closes, 12), if the caller has it
 
     Returns:
         MACDResult or None if insufficient data
@@ -51,25 +60,27 @@ def compute_macd(closes: List[float]) -> Optional[MACDResult]:
     if len(closes) < 26:
         return None
 
-    # Compute fast and slow EMAs
-    fast_ema = compute_ema(closes, 12)
-    slow_ema = compute_ema(closes, 26)
-
-    if not fast_ema or not slow_ema:
-        return None
-
-    # MACD line = fast - slow
-    macd_line = [f - s for f, s in zip(fast_ema, slow_ema)]
-
-    # Signal line = EMA(9) of MACD
-    signal = compute_ema(macd_line, 9)
-
-    if not signal or len(signal) == 0:
-        return None
+    # Compute fast EMA
+    if fast_ema is None:
+        fast_ema = compute_ema(closes, 12)
+
+    # Slow EMA(26), MACD line (fast - slow) and signal line (EMA(9) of MACD)
+    # in one pass, carrying only the latest values; same recurrences as
+    # compute_ema, each seeded with its first input
+    k_slow = 2 / (26 + 1)
+    k_slow_prev = 1 - k_slow
+    k_signal = 2 / (9 + 1)
+    k_signal_prev = 1 - k_signal
+
+    slow = closes[0]
+    macd_val = fast_ema[0] - slow
+    signal_val = macd_val
+    for close, fast in zip(closes[1:], fast_ema[1:]):
+        slow = close * k_slow + slow * k_slow_prev
+        macd_val = fast - slow
+        signal_val = macd_val * k_signal + signal_val * k_signal_prev
 
     # Histogram = MACD - Signal
-    macd_val = macd_line[-1]
-    signal_val = signal[-1]
     hist = macd_val - signal_val
 
     # Determine bias
@@ -97,21 +108,20 @@ def compute_rsi(closes: List[float], period: int = 14) -> Optional[RSIResult]:
     if len(closes) < period + 1:
         return None
 
-    # Calculate gains and losses
-    gains = []
-    losses = []
-
-    for i in range(1, len(closes)):
-        change = closes[i] - closes[i - 1]
-        gains.append(max(0, change))
-        losses.append(max(0, -change))
+    # Sum gains and losses over the last period changes only; earlier
+    # changes never enter the averages
+    gain_sum = 0
+    loss_sum = 0
+    prev = closes[-period - 1]
+    for close in closes[-period:]:
+        change = close - prev
+        gain_sum += max(0, change)
+        loss_sum += max(0, -change)
+        prev = close
 
     # Average gains and losses over period
-    if len(gains) < period:
-        return None
-
-    avg_gain = sum(gains[-period:]) / period
-    avg_loss = sum(losses[-period:]) / period
+    avg_gain = gain_sum / period
+    avg_loss = loss_sum / period
 
     # Calculate RSI
     if avg_loss == 0:
@@ -152,18 +162,41 @@ def compute_sma(closes: List[float], period: int = 20) -> Optional[float]:
     return sum(closes[-period:]) / period
 
 
-def compute_trend(closes: List[float], sma_period: int = 20) -> Optional[TrendSummary]:
+def compute_smas(closes: List[float], periods: Tuple[int, ...] = (10, 20, 50, 100)) -> List[Optional[float]]:
+    """
+    Compute several Simple Moving Averages in one call
+
+    The longest window is sliced once and the shorter windows are taken
+    from its tail, so each SMA sums exactly the values compute_sma would.
+
+    Args:
+        closes: Closing prices (oldest to newest)
+        periods: SMA periods
+
+    Returns:
+        SMA values in the order of periods (None where data is insufficient)
+    """
+    tail = closes[-max(periods):]
+    n = len(closes)
+    return [sum(tail[-period:]) / period if n >= period else None for period in periods]
+
+
+def compute_trend(
+    closes: List[float], sma_period: int = 20, sma: Optional[float] = None
+) -> Optional[TrendSummary]:
     """
     Compute trend analysis using SMA
 
     Args:
         closes: Closing prices (oldest to newest)
         sma_period: SMA period for trend calculation
+        sma: Optional precomputed SMA(sma_period) of closes (e.g. from compute_smas)
 
     Returns:
         TrendSummary or None if insufficient data
     """
-    sma = compute_sma(closes, sma_period)
+    if sma is None:
+        sma = compute_sma(closes, sma_period)
     if sma is None or len(closes) == 0:
         return None
 
@@ -273,15 +306,12 @@ def count_recovery_patterns(closes: List[float], lookback_days: int = 180) -> in
     recovery_count = 0
     in_dip = False
 
-    # Scan through the period looking for dip → recovery patterns
+    # Scan through the period looking for dip → recovery patterns.
+    # SMAs are summed over just their own window at each step (not a copy of
+    # the whole prefix), and SMA(10) only when a recovery needs confirming.
     for i in range(50, len(period_closes)):
-        window = period_closes[:i+1]
-        sma50 = compute_sma(window, 50)
-        sma10 = compute_sma(window, 10)
-        current_price = window[-1]
-
-        if sma50 is None or sma10 is None:
-            continue
+        current_price = period_closes[i]
+        sma50 = sum(period_closes[i - 49:i + 1]) / 50
 
         # Detect dip: price below SMA(50)
         if current_price < sma50 and not in_dip:
@@ -290,6 +320,7 @@ def count_recovery_patterns(closes: List[float], lookback_days: int = 180) -> in
         # Detect recovery: price back above SMA(50) with momentum
         elif current_price > sma50 and in_dip:
             # Confirm recovery with upward momentum
+            sma10 = sum(period_closes[i - 9:i + 1]) / 10
             if current_price > sma10:
                 recovery_count += 1
             in_dip = False
@@ -297,7 +328,9 @@ def count_recovery_patterns(closes: List[float], lookback_days: int = 180) -> in
     return recovery_count
 
 
-def compute_long_term_trend(closes: List[float], period: int = 100) -> Optional[TrendBias]:
+def compute_long_term_trend(
+    closes: List[float], period: int = 100, sma: Optional[float] = None
+) -> Optional[TrendBias]:
     """
     Determine long-term trend using longer SMA period.
 
@@ -306,11 +339,12 @@ def compute_long_term_trend(closes: List[float], period: int = 100) -> Optional[
     Args:
         closes: Closing prices (oldest to newest)
         period: SMA period for long-term trend (default 100)
+        sma: Optional precomputed SMA(period) of closes
 
     Returns:
         TrendBias (UP/DOWN/SIDEWAYS) or None if insufficient data
     """
-    trend = compute_trend(closes, period)
+    trend = compute_trend(closes, period, sma)
     return trend.bias if trend else None
 
 
@@ -340,14 +374,15 @@ def compute_rally_magnitude(closes: List[float], lookback_days: int = 90) -> Opt
     lookback = closes[-lookback_days:]
     max_rally_pct = 0.0
 
-    # Find largest trough-to-peak rally
-    for i in range(len(lookback)):
+    # Find largest trough-to-peak rally in one backward pass: walking from
+    # the newest day, peak is the highest close after the current trough
+    peak = lookback[-1]
+    for i in range(len(lookback) - 2, -1, -1):
         trough = lookback[i]
-        # Look for peak after this trough
-        if i < len(lookback) - 1:
-            peak = max(lookback[i+1:])
-            rally_pct = ((peak - trough) / trough) * 100 if trough > 0 else 0
-            max_rally_pct = max(max_rally_pct, rally_pct)
+        rally_pct = ((peak - trough) / trough) * 100 if trough > 0 else 0
+        max_rally_pct = max(max_rally_pct, rally_pct)
+        if trough > peak:
+            peak = trough
 
     return max_rally_pct
 
@@ -463,7 +498,95 @@ def compute_trend_slope(closes: List[float], period: int = 100) -> Optional[floa
     return annualized_slope_pct
 
 
-def compute_beta(stock_closes: List[float], market_closes: List[float], min_periods: int = 240) -> Optional[float]:
+def align_by_date(
+    dates1: List[str],
+    closes1: List[float],
+    dates2: List[str],
+    closes2: List[float],
+) -> Tuple[List[float], List[float]]:
+    """
+    Align two close series by date, keeping closes on common dates only
+
+    Both date lists must be sorted ascending (as returned by
+    get_daily_closes / get_daily_columns), so a single two-pointer merge
+    finds the overlap without building maps or sorting.
+
+    Args:
+        dates1: ISO dates of the first series (ascending)
+        closes1: Closes of the first series
+        dates2: ISO dates of the second series (ascending)
+        closes2: Closes of the second series
+
+    Returns:
+        Tuple of (aligned closes1, aligned closes2)
+    """
+    aligned1: List[float] = []
+    aligned2: List[float] = []
+    i = j = 0
+    n1, n2 = len(dates1), len(dates2)
+
+    while i < n1 and j < n2:
+        date1 = dates1[i]
+        date2 = dates2[j]
+        if date1 == date2:
+            aligned1.append(closes1[i])
+            aligned2.append(closes2[j])
+            i += 1
+            j += 1
+        elif date1 < date2:
+            i += 1
+        else:
+            j += 1
+
+    return aligned1, aligned2
+
+
+def _daily_returns(closes: List[float]) -> Optional[List[float]]:
+    """Daily returns of a close series, or None if any price is zero"""
+    returns = []
+    for i in range(1, len(closes)):
+        if closes[i-1] != 0:
+            ret = (closes[i] - closes[i-1]) / closes[i-1]
+            returns.append(ret)
+        else:
+            return None  # Can't calculate with zero prices
+    return returns
+
+
+def compute_benchmark_stats(market_closes: List[float]) -> Optional[BenchmarkStats]:
+    """
+    Compute the market-side statistics of beta for a benchmark series
+
+    These depend only on the benchmark, so callers computing beta for many
+    stocks against the same benchmark series can compute them once and pass
+    them to compute_beta.
+
+    Args:
+        market_closes: Market closing prices (oldest to newest)
+
+    Returns:
+        BenchmarkStats or None if returns can't be computed or don't vary
+    """
+    market_returns = _daily_returns(market_closes)
+    if market_returns is None or len(market_returns) < 2:
+        return None
+
+    mean_market = statistics.mean(market_returns)
+
+    # Variance(Y) = E[(Y - mean_Y)^2]
+    variance = sum((m - mean_market) ** 2 for m in market_returns) / len(market_returns)
+    if variance == 0:
+        return None
+
+    return BenchmarkStats(returns=market_returns, mean=mean_market, variance=variance)
+
+
+def compute_beta(
+    stock_closes: List[float],
+    market_closes: List[float],
+    min_periods: int = 240,
+    market_stats: Optional[BenchmarkStats] = None,
+) -> Optional[float]:
     """
     Calculate beta (stock volatility relative to market) using 12 months of daily data
 
@@ -473,6 +596,8 @@ def compute_beta(stock_closes: List[float], market_closes: List[float], min_peri
         stock_closes: Stock closing prices (oldest to newest)
         market_closes: Market (SPY) closing prices (oldest to newest)
         min_periods: Minimum number of data points required (default 240 ≈ 12 months)
+        market_stats: Optional precomputed compute_benchmark_stats(market_closes),
+            valid only when both series have the same length
 
     Returns:
         Beta value or None if insufficient data
@@ -487,46 +612,32 @@ def compute_beta(stock_closes: List[float], market_closes: List[float], min_peri
         return None
 
     # Truncate both to same length (use most recent data)
+    if len(stock_closes) != len(market_closes):
+        market_stats = None  # Stats are for the untruncated market series
     stock_closes = stock_closes[-common_length:]
     market_closes = market_closes[-common_length:]
 
     # Calculate daily returns for stock
-    stock_returns = []
-    for i in range(1, len(stock_closes)):
-        if stock_closes[i-1] != 0:
-            ret = (stock_closes[i] - stock_closes[i-1]) / stock_closes[i-1]
-            stock_returns.append(ret)
-        else:
-            return None  # Can't calculate with zero prices
-
-    # Calculate daily returns for market
-    market_returns = []
-    for i in range(1, len(market_closes)):
-        if market_closes[i-1] != 0:
-            ret = (market_closes[i] - market_closes[i-1]) / market_closes[i-1]
-            market_returns.append(ret)
-        else:
-            return None  # Can't calculate with zero prices
-
-    if len(stock_returns) < 2 or len(market_returns) < 2:
+    stock_returns = _daily_returns(stock_closes)
+    if stock_returns is None or len(stock_returns) < 2:
         return None
 
-    # Calculate covariance and variance
+    # Market returns, mean and variance (shared across stocks when precomputed)
+    if market_stats is None:
+        market_stats = compute_benchmark_stats(market_closes)
+        if market_stats is None:
+            return None
+
+    # Calculate covariance
     try:
         mean_stock = statistics.mean(stock_returns)
-        mean_market = statistics.mean(market_returns)
+        mean_market = market_stats.mean
 
         # Covariance(X, Y) = E[(X - mean_X)(Y - mean_Y)]
         covariance = sum((s - mean_stock) * (m - mean_market)
-                        for s, m in zip(stock_returns, market_returns)) / len(stock_returns)
+                        for s, m in zip(stock_returns, market_stats.returns)) / len(stock_returns)
 
-        # Variance(Y) = E[(Y - mean_Y)^2]
-        variance = sum((m - mean_market) ** 2 for m in market_returns) / len(market_returns)
-
-        if variance == 0:
-            return None
-
-        beta = covariance / variance
+        beta = covariance / market_stats.variance
         return beta
     except:
         return None
@@ -547,37 +658,23 @@ def find_support_resistance(closes: List[float], window: int = 5) -> tuple[Optio
         return (None, None)
 
     current_price = closes[-1]
-    swing_highs = []
-    swing_lows = []
-
-    # Find swing highs and swing lows
-    for i in range(window, len(closes) - window):
-        # Check if this is a swing high (local maximum)
-        is_swing_high = True
-        is_swing_low = True
-
-        for j in range(1, window + 1):
-            # Check left and right neighbors
-            if closes[i] <= closes[i - j] or closes[i] <= closes[i + j]:
-                is_swing_high = False
-            if closes[i] >= closes[i - j] or closes[i] >= closes[i + j]:
-                is_swing_low = False
-
-        if is_swing_high:
-            swing_highs.append(closes[i])
-        if is_swing_low:
-            swing_lows.append(closes[i])
-
-    # Find nearest resistance (swing high above current price)
+    support = None
     resistance = None
-    resistance_candidates = [h for h in swing_highs if h > current_price]
-    if resistance_candidates:
-        resistance = min(resistance_candidates)  # Nearest above
 
-    # Find nearest support (swing low below current price)
-    support = None
-    support_candidates = [l for l in swing_lows if l < current_price]
-    if support_candidates:
-        support = max(support_candidates)  # Nearest below
+    # Find swing highs and swing lows in one pass, keeping only the nearest
+    for i in range(window, len(closes) - window):
+        price = closes[i]
+        # Only levels on the right side of the current price can qualify,
+        # so the neighbour scan is skipped for the rest
+        if price > current_price:
+            # Swing high (strict local maximum): nearest one above is resistance
+            if (resistance is None or price < resistance) and \
+                    price > max(closes[i - window:i]) and price > max(closes[i + 1:i + window + 1]):
+                resistance = price
+        elif price < current_price:
+            # Swing low (strict local minimum): nearest one below is support
+            if (support is None or price > support) and \
+                    price < min(closes[i - window:i]) and price < min(closes[i + 1:i + window + 1]):
+                support = price
 
     return (support, resistance)
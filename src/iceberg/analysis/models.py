@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import List
 
 
 class MACDBias(Enum):
@@ -71,3 +72,12 @@ class VolatilitySummary:
 
     sigma: float
     bias: VolatilityBias
+
+
+@dataclass
+class BenchmarkStats:
+    """Daily-return statistics of a benchmark series, reusable across beta calculations"""
+
+    returns: List[float]
+    mean: float
+    variance: float
@@ -30,9 +30,18 @@ Investment Score (Long-term quality assessment):
 - Validated across spectrum (MU/GOOGL=100, MSFT=82, META=58, IBIT=34)
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from dataclasses import dataclass
-from .models import MACDBias, RSIBias, TrendBias, VolatilityBias
+from .models import (
+    MACDBias,
+    MACDResult,
+    RSIBias,
+    RSIResult,
+    TrendBias,
+    TrendSummary,
+    VolatilityBias,
+    VolatilitySummary,
+)
 
 
 @dataclass
@@ -55,6 +64,76 @@ class ScoreResult:
         return self.turnaround_raw if self.turnaround_active else self.bau_raw
 
 
+@dataclass
+class ScoreInputs:
+    """Indicator values shared by the trade and investment scores."""
+    current_price: float
+    macd_bias: Optional[MACDBias]
+    macd_hist: Optional[float]
+    rsi_value: Optional[float]
+    rsi_bias: Optional[RSIBias]
+    sma10: Optional[float]
+    sma20: Optional[float]
+    sma50: Optional[float]
+    sma100: Optional[float]
+    trend10_bias: Optional[TrendBias]
+    trend50_bias: Optional[TrendBias]
+    long_term_trend: Optional[TrendBias]
+    volatility_bias: Optional[VolatilityBias]
+    distance_from_high: Optional[float] = None
+    resilience_count: int = 0
+    closes: Optional[List[float]] = None
+    support: Optional[float] = None
+    resistance: Optional[float] = None
+    trend_slope: Optional[float] = None
+    volatility_sigma: Optional[float] = None
+
+    @classmethod
+    def from_indicators(
+        cls,
+        current_price: float,
+        macd: Optional[MACDResult],
+        rsi: Optional[RSIResult],
+        sma10: Optional[float],
+        sma20: Optional[float],
+        sma50: Optional[float],
+        sma100: Optional[float],
+        trend10: Optional[TrendSummary],
+        trend50: Optional[TrendSummary],
+        long_term_trend: Optional[TrendBias],
+        volatility: Optional[VolatilitySummary],
+        distance_from_high: Optional[float] = None,
+        resilience_count: int = 0,
+        closes: Optional[List[float]] = None,
+        support: Optional[float] = None,
+        resistance: Optional[float] = None,
+        trend_slope: Optional[float] = None,
+    ) -> "ScoreInputs":
+        """Build inputs from indicator results, any of which may be None."""
+        return cls(
+            current_price=current_price,
+            macd_bias=macd.bias if macd else None,
+            macd_hist=macd.hist if macd else None,
+            rsi_value=rsi.value if rsi else None,
+            rsi_bias=rsi.bias if rsi else None,
+            sma10=sma10,
+            sma20=sma20,
+            sma50=sma50,
+            sma100=sma100,
+            trend10_bias=trend10.bias if trend10 else None,
+            trend50_bias=trend50.bias if trend50 else None,
+            long_term_trend=long_term_trend,
+            volatility_bias=volatility.bias if volatility else None,
+            distance_from_high=distance_from_high,
+            resilience_count=resilience_count,
+            closes=closes,
+            support=support,
+            resistance=resistance,
+            trend_slope=trend_slope,
+            volatility_sigma=volatility.sigma if volatility else None,
+        )
+
+
 # ============================================================================
 # TRADE SCORE - Short-term entry timing (days/weeks)
 # ============================================================================
@@ -77,7 +156,8 @@ def calculate_trade_score(
     resilience_count: int = 0,
     closes: Optional[List[float]] = None,
     support: Optional[float] = None,
-    resistance: Optional[float] = None
+    resistance: Optional[float] = None,
+    trend_slope: Optional[float] = None
 ) -> ScoreResult:
     """
     Calculate Trade Score for short-term trading signals (days/weeks).
@@ -92,6 +172,7 @@ def calculate_trade_score(
 
     Args:
         All technical indicators available
+        trend_slope: Optional precomputed compute_trend_slope(closes, 100)
 
     Returns:
         ScoreResult with scores 0-100
@@ -236,8 +317,9 @@ def calculate_trade_score(
     # Structural decline - severe long-term deterioration
     # Check trend slope to catch gradual but persistent decline
     if len(closes) >= 100:
-        from .indicators import compute_trend_slope
-        trend_slope = compute_trend_slope(closes, 100)
+        if trend_slope is None:
+            from .indicators import compute_trend_slope
+            trend_slope = compute_trend_slope(closes, 100)
         if trend_slope is not None and trend_slope < -30:
             score -= 15  # Severe structural decline
 
@@ -284,7 +366,9 @@ def calculate_investment_score(
     volatility_bias: Optional[VolatilityBias],
     distance_from_high: Optional[float] = None,
     resilience_count: int = 0,
-    closes: Optional[List[float]] = None
+    closes: Optional[List[float]] = None,
+    trend_slope: Optional[float] = None,
+    volatility_sigma: Optional[float] = None
 ) -> ScoreResult:
     """
     Calculate Investment Score for long-term quality assessment (months/years).
@@ -303,6 +387,8 @@ def calculate_investment_score(
 
     Args:
         All technical indicators available
+        trend_slope: Optional precomputed compute_trend_slope(closes, 100)
+        volatility_sigma: Optional precomputed compute_volatility(closes).sigma
 
     Returns:
         ScoreResult with scores 0-100
@@ -327,8 +413,9 @@ def calculate_investment_score(
         compute_return_to_highs_frequency
     )
 
-    # Calculate long-term indicators
-    trend_slope = compute_trend_slope(closes, 100)
+    # Calculate long-term indicators (trend slope may be shared by the caller)
+    if trend_slope is None:
+        trend_slope = compute_trend_slope(closes, 100)
     rally_magnitude = compute_rally_magnitude(closes, 90)
     return_to_highs = compute_return_to_highs_frequency(closes, 180)
 
@@ -444,11 +531,13 @@ def calculate_investment_score(
     elif volatility_bias == VolatilityBias.WILD:
         # Wild volatility (>3%) - tiered penalties based on severity
         # Calculate approximate sigma from closes for finer granularity
-        from .indicators import compute_volatility
-        vol_result = compute_volatility(closes)
-        if vol_result and vol_result.sigma > 10:
+        if volatility_sigma is None:
+            from .indicators import compute_volatility
+            vol_result = compute_volatility(closes)
+            volatility_sigma = vol_result.sigma if vol_result else None
+        if volatility_sigma is not None and volatility_sigma > 10:
             score -= 15  # Extremely wild (>10% daily sigma)
-        elif vol_result and vol_result.sigma > 5:
+        elif volatility_sigma is not None and volatility_sigma > 5:
             score -= 10  # Very wild (5-10% daily sigma)
         else:
             score -= 5   # Wild (3-5% daily sigma)
@@ -503,6 +592,75 @@ def calculate_investment_score(
     )
 
 
+# ============================================================================
+# BOTH SCORES - One set of inputs for trade and investment scores
+# ============================================================================
+
+def calculate_scores(inputs: ScoreInputs) -> Tuple[ScoreResult, ScoreResult]:
+    """
+    Calculate both Trade and Investment Scores from one set of inputs.
+
+    Inputs both scores derive from closes (the 100-day trend slope) are
+    computed once here when not supplied, instead of once per score.
+
+    Args:
+        inputs: Indicator values for the ticker
+
+    Returns:
+        Tuple of (trade ScoreResult, investment ScoreResult)
+    """
+    closes = inputs.closes
+    trend_slope = inputs.trend_slope
+    if trend_slope is None and closes is not None and len(closes) >= 100:
+        from .indicators import compute_trend_slope
+        trend_slope = compute_trend_slope(closes, 100)
+
+    trade_result = calculate_trade_score(
+        current_price=inputs.current_price,
+        macd_bias=inputs.macd_bias,
+        macd_hist=inputs.macd_hist,
+        rsi_value=inputs.rsi_value,
+        rsi_bias=inputs.rsi_bias,
+        sma10=inputs.sma10,
+        sma20=inputs.sma20,
+        sma50=inputs.sma50,
+        sma100=inputs.sma100,
+        trend10_bias=inputs.trend10_bias,
+        trend50_bias=inputs.trend50_bias,
+        long_term_trend=inputs.long_term_trend,
+        volatility_bias=inputs.volatility_bias,
+        distance_from_high=inputs.distance_from_high,
+        resilience_count=inputs.resilience_count,
+        closes=closes,
+        support=inputs.support,
+        resistance=inputs.resistance,
+        trend_slope=trend_slope
+    )
+
+    inv_result = calculate_investment_score(
+        current_price=inputs.current_price,
+        macd_bias=inputs.macd_bias,
+        macd_hist=inputs.macd_hist,
+        rsi_value=inputs.rsi_value,
+        rsi_bias=inputs.rsi_bias,
+        sma10=inputs.sma10,
+        sma20=inputs.sma20,
+        sma50=inputs.sma50,
+        sma100=inputs.sma100,
+        trend10_bias=inputs.trend10_bias,
+        trend50_bias=inputs.trend50_bias,
+        long_term_trend=inputs.long_term_trend,
+        volatility_bias=inputs.volatility_bias,
+        distance_from_high=inputs.distance_from_high,
+        resilience_count=inputs.resilience_count,
+        closes=closes,
+        trend_slope=trend_slope,
+        volatility_sigma=inputs.volatility_sigma
+    )
+
+    return trade_result, inv_result
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -11,6 +11,7 @@ from textual.timer import Timer
 
 from .config import Config
 from .data.db import Database
+from .data.plot_cache import PlotCache
 from .api.finnhub import FinnhubClient
 from .widgets.market_indices import MarketIndices
 from .widgets.ticker_banner import TickerBanner
@@ -74,7 +75,13 @@ class IcebergApp(App):
                 yield TickerBanner(self.db, id="ticker_banner")
                 yield Watchlist(self.db, self.config.watchlist_csv, self.day_range, id="watchlist")
             with Vertical(id="main_display"):
-                yield ChartPanel(self.db, self.config.chart_height, self.day_range, id="chart")
+                yield ChartPanel(
+                    self.db,
+                    self.config.chart_height,
+                    self.day_range,
+                    plot_cache=PlotCache(self.config.chart_cache_path),
+                    id="chart",
+                )
                 yield TechnicalPanel(self.db, self.day_range, id="technical")
                 yield ScoresPanel(self.db, self.day_range, id="scores")
 
@@ -393,15 +400,21 @@ class IcebergApp(App):
 
     def _update_prices_worker(self) -> None:
         """Worker thread to fetch and update prices (runs in background)"""
+        from datetime import datetime
+
         watchlist = self.query_one("#watchlist", Watchlist)
         tickers = [item.ticker for item in watchlist.items]
 
         total = len(tickers)
         success_count = 0
 
+        # One fetch timestamp for the whole batch
+        fetched_at_utc = datetime.utcnow().isoformat()
+
         # Update status bar to show progress
         status = self.query_one("#status_bar", StatusBar)
 
+        quotes = []
         for i, ticker in enumerate(tickers, 1):
             # Update progress in status bar (blue)
             self.call_from_thread(
@@ -414,8 +427,12 @@ class IcebergApp(App):
             quote = self.finnhub.get_quote(ticker)
 
             if quote:
-                # Insert/update in database
-                if self.db.upsert_from_finnhub_quote(ticker, quote):
+                quotes.append((ticker, quote))
+
+        # Insert/update in database as a single transaction (one commit)
+        with self.db.transaction():
+            for ticker, quote in quotes:
+                if self.db.upsert_from_finnhub_quote(ticker, quote, fetched_at_utc):
                     success_count += 1
 
         # Update complete - refresh all widgets
@@ -15,6 +15,9 @@ class Config:
         self.db_path = project_root / ".." / "StockStreet" / "Data" / "stockstreet.sqlite"
         self.watchlist_csv = project_root / ".." / "StockStreet" / "Data" / "nasdaq100.csv"
 
+        # Rendered chart cache (safe to delete)
+        self.chart_cache_path = Path.home() / ".cache" / "iceberg" / "charts.sqlite"
+
         # Display settings
         self.default_day_range = 30
         self.chart_height = 20
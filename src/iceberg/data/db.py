@@ -1,30 +1,166 @@
 """SQLite database connection and queries"""
 
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
-from datetime import datetime
+from functools import wraps
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Tuple
 
 from .models import DailyPrice
 
 
+def utc_today() -> date:
+    """Today's date as SQLite's date('now') sees it (UTC)
+
+    Key anything derived from the date('now', '-N days') windows on this
+    rather than date.today(), which rolls over at local midnight.
+    """
+    return datetime.now(timezone.utc).date()
+
+
+def _read_through(method: Callable) -> Callable:
+    """Serve a per-ticker read (ticker is the first argument) from the read cache"""
+
+    @wraps(method)
+    def wrapper(self: "Database", ticker: str, *args: Any) -> Any:
+        # Keyed by the current date so the date-relative lookback queries
+        # roll over at (UTC) midnight
+        key = (ticker, method.__name__, utc_today()) + args
+        return self._cached_read(key, lambda: method(self, ticker, *args))
+
+    return wrapper
+
+
 class Database:
     """SQLite database connection manager"""
 
+    READ_CACHE_SIZE = 256  # Per-ticker read results kept in memory (LRU)
+    # Seconds a cached read is served. Writes through this Database drop
+    # entries immediately; the TTL only backstops writes made by other
+    # processes (e.g. StockStreet) to the same file.
+    READ_CACHE_TTL = 300.0
+
     def __init__(self, db_path: Path):
         self.db_path = db_path
+        self.version = 0  # Bumped on every committed write so readers can spot new data
+        self._local = threading.local()  # Per-thread open transaction connection
+        self._listeners: List[Callable[[str], None]] = []  # Called with changed ticker
+        # (ticker, method, date, *args) -> (stored_at, result); dropped per
+        # ticker on committed writes
+        self._read_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._read_lock = threading.Lock()  # Reads on the UI thread, writes on workers
+        self._read_generation = 0  # Bumped on invalidation; guards in-flight reads
+
+    def on_update(self, callback: Callable[[str], None]) -> None:
+        """Register callback(ticker), called after a write to that ticker's prices
+
+        Callbacks run on the writing thread once the write is committed
+        (after the whole block when inside transaction()).
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, ticker: str) -> None:
+        """Tell listeners ticker changed, deferring to commit inside a transaction"""
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending[ticker] = None
+            return
+
+        with self._read_lock:
+            self._read_generation += 1
+            for key in [k for k in self._read_cache if k[0] == ticker]:
+                del self._read_cache[key]
+            # Bumped only once the write is committed and stale reads are
+            # dropped, so results keyed by a version never predate its data
+            self.version += 1
+
+        for callback in self._listeners:
+            callback(ticker)
+
+    def _cached_read(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """Return the cached result for key, or fetch() and cache it
+
+        Reads inside a transaction bypass the cache (they may see
+        uncommitted rows). A result is only stored if no write was
+        committed while it was being fetched, and is re-fetched once
+        older than READ_CACHE_TTL. Callers must not mutate the returned
+        value.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            return fetch()
+
+        now = time.monotonic()
+        with self._read_lock:
+            entry = self._read_cache.get(key)
+            if entry is not None and now - entry[0] < self.READ_CACHE_TTL:
+                self._read_cache.move_to_end(key)
+                return entry[1]
+            generation = self._read_generation
+
+        result = fetch()
+
+        with self._read_lock:
+            if generation == self._read_generation:
+                self._read_cache[key] = (now, result)
+                self._read_cache.move_to_end(key)
+                if len(self._read_cache) > self.READ_CACHE_SIZE:
+                    self._read_cache.popitem(last=False)
+        return result
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
+        """Context manager for database connections
+
+        Connections run in autocommit mode; use transaction() to batch
+        writes. Inside a transaction, the transaction's connection is reused.
+        """
+        tx_conn = getattr(self._local, "conn", None)
+        if tx_conn is not None:
+            yield tx_conn
+            return
+
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
         conn.row_factory = sqlite3.Row  # Return rows as dict-like objects
         try:
             yield conn
         finally:
             conn.close()
 
+    @contextmanager
+    def transaction(self):
+        """Context manager grouping writes into one BEGIN IMMEDIATE ... COMMIT
+
+        Writes made on this thread inside the block share one connection
+        and are committed together (a single fsync instead of one per write).
+        Rolls back if the block raises. Nested calls join the outer transaction.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._local.conn = conn
+            self._local.pending = {}  # Tickers written, in order, notified on commit
+            try:
+                yield
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+            finally:
+                self._local.conn = None
+                pending, self._local.pending = self._local.pending, None
+
+        for ticker in pending:
+            self._notify(ticker)
+
+    @_read_through
     def get_daily_prices(self, ticker: str, days: int) -> List[DailyPrice]:
         """Fetch last N calendar days of price data for ticker"""
         with self.get_connection() as conn:
@@ -40,6 +176,28 @@ class Database:
             rows = cursor.fetchall()
             return [DailyPrice.from_row(row) for row in rows]
 
+    @_read_through
+    def get_price_date_range(self, ticker: str, days: int) -> Optional[Tuple[date, date]]:
+        """First and last trade dates within the last N calendar days
+
+        Same window as get_daily_prices, aggregated in SQL so only the two
+        endpoints are returned. None if the window holds fewer than 2 rows.
+        """
+        with self.get_connection() as conn:
+            query = """
+                SELECT MIN(trade_date), MAX(trade_date), COUNT(*)
+                FROM prices_daily
+                WHERE ticker = ?
+                AND trade_date >= date('now', '-' || ? || ' days')
+            """
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuple, no sqlite3.Row boxing
+            first, last, count = cursor.execute(query, (ticker, days)).fetchone()
+            if count < 2:
+                return None
+            return date.fromisoformat(first), date.fromisoformat(last)
+
+    @_read_through
     def get_latest_price(self, ticker: str) -> Optional[DailyPrice]:
         """Get most recent price for ticker"""
         with self.get_connection() as conn:
@@ -55,6 +213,7 @@ class Database:
             row = cursor.fetchone()
             return DailyPrice.from_row(row) if row else None
 
+    @_read_through
     def get_previous_close(self, ticker: str) -> Optional[float]:
         """Get previous day's closing price (for % change calc)"""
         with self.get_connection() as conn:
@@ -69,10 +228,116 @@ class Database:
             row = cursor.fetchone()
             return row[0] if row else None
 
+    def get_latest_and_prev_batch(
+        self, tickers: List[str]
+    ) -> Dict[str, Tuple[Optional[DailyPrice], Optional[float]]]:
+        """Latest price and previous close for many tickers in one query
+
+        Batch equivalent of get_latest_price + get_previous_close. Tickers
+        with no rows map to (None, None); with one row, previous is None.
+        """
+        result: Dict[str, Tuple[Optional[DailyPrice], Optional[float]]] = {
+            ticker: (None, None) for ticker in tickers
+        }
+        if not tickers:
+            return result
+
+        wanted = list(result)  # Deduplicated, so each ticker joins once
+        with self.get_connection() as conn:
+            values = ", ".join("(?)" for _ in wanted)
+            # Driven from the ticker list so each ticker's two latest dates
+            # come from a LIMIT 2 walk of the primary key index, instead of
+            # ranking every historical row
+            query = f"""
+                WITH wanted(ticker) AS (VALUES {values})
+                SELECT p.ticker, p.trade_date, p.open, p.high, p.low, p.close,
+                       p.adj_close, p.volume, p.currency
+                FROM wanted
+                JOIN prices_daily AS p
+                  ON p.ticker = wanted.ticker
+                 AND p.trade_date IN (
+                     SELECT trade_date
+                     FROM prices_daily
+                     WHERE ticker = wanted.ticker
+                     ORDER BY trade_date DESC
+                     LIMIT 2
+                 )
+                ORDER BY p.ticker, p.trade_date DESC
+            """
+            for row in conn.execute(query, wanted):
+                ticker = row["ticker"]
+                latest = result[ticker][0]
+                if latest is None:
+                    result[ticker] = (DailyPrice.from_row(row), None)
+                else:
+                    result[ticker] = (latest, row["close"])
+
+        return result
+
+    @_read_through
     def get_closing_prices(self, ticker: str, days: int) -> List[float]:
-        """Get list of closing prices for technical analysis"""
-        prices = self.get_daily_prices(ticker, days)
-        return [p.close for p in prices]
+        """Get list of closing prices for technical analysis
+
+        Selects only the close column with plain tuple rows, skipping
+        DailyPrice construction for callers that just need the series.
+        """
+        with self.get_connection() as conn:
+            query = """
+                SELECT close
+                FROM prices_daily
+                WHERE ticker = ?
+                AND trade_date >= date('now', '-' || ? || ' days')
+                ORDER BY trade_date ASC
+            """
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples, no sqlite3.Row boxing
+            cursor.execute(query, (ticker, days))
+            return [row[0] for row in cursor]
+
+    @_read_through
+    def get_daily_closes(self, ticker: str, days: int) -> Tuple[List[str], List[float]]:
+        """Get (trade dates, closes) as parallel lists for the last N days
+
+        Column-oriented variant of get_daily_prices for callers that only
+        need dates and closes: no DailyPrice or date objects are built.
+        Dates are ISO strings (YYYY-MM-DD), so they sort and compare as dates.
+        """
+        with self.get_connection() as conn:
+            query = """
+                SELECT trade_date, close
+                FROM prices_daily
+                WHERE ticker = ?
+                AND trade_date >= date('now', '-' || ? || ' days')
+                ORDER BY trade_date ASC
+            """
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples, no sqlite3.Row boxing
+            cursor.execute(query, (ticker, days))
+            rows = cursor.fetchall()
+            return [row[0] for row in rows], [row[1] for row in rows]
+
+    @_read_through
+    def get_daily_columns(
+        self, ticker: str, days: int
+    ) -> Tuple[List[str], List[float], List[int]]:
+        """Get (trade dates, closes, volumes) as parallel lists for the last N days
+
+        Column-oriented like get_daily_closes, for callers that also need
+        volumes. Dates are ISO strings (YYYY-MM-DD).
+        """
+        with self.get_connection() as conn:
+            query = """
+                SELECT trade_date, close, volume
+                FROM prices_daily
+                WHERE ticker = ?
+                AND trade_date >= date('now', '-' || ? || ' days')
+                ORDER BY trade_date ASC
+            """
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples, no sqlite3.Row boxing
+            cursor.execute(query, (ticker, days))
+            rows = cursor.fetchall()
+            return [row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows]
 
     def upsert_daily_price(
         self,
@@ -86,20 +351,38 @@ class Database:
         adj_close: Optional[float] = None,
         currency: str = "USD",
         source: str = "finnhub",
+        fetched_at_utc: Optional[str] = None,
     ) -> None:
         """Insert or update daily price data (single entry per date)
 
-        Uses INSERT OR REPLACE to ensure only one entry per ticker+date.
-        Updates existing entry if it exists, inserts if it doesn't.
+        Uses an upsert (INSERT ... ON CONFLICT DO UPDATE) on the
+        ticker+date key so there is only one entry per ticker+date.
+        Updates the existing row in place if it exists, inserts if it
+        doesn't (unlike INSERT OR REPLACE, no delete + reinsert).
+
+        Batch callers can pass fetched_at_utc once for every row instead
+        of formatting a fresh timestamp per insert.
         """
-        with self.get_connection() as conn:
+        if fetched_at_utc is None:
             fetched_at_utc = datetime.utcnow().isoformat()
 
+        with self.get_connection() as conn:
+
             query = """
-                INSERT OR REPLACE INTO prices_daily (
+                INSERT INTO prices_daily (
                     ticker, trade_date, open, high, low, close,
                     adj_close, volume, currency, source, fetched_at_utc
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ticker, trade_date) DO UPDATE SET
+                    open = excluded.open,
+                    high = excluded.high,
+                    low = excluded.low,
+                    close = excluded.close,
+                    adj_close = excluded.adj_close,
+                    volume = excluded.volume,
+                    currency = excluded.currency,
+                    source = excluded.source,
+                    fetched_at_utc = excluded.fetched_at_utc
             """
 
             conn.execute(
@@ -118,10 +401,14 @@ class Database:
                     fetched_at_utc,
                 ),
             )
-            conn.commit()
+
+        self._notify(ticker)
 
     def upsert_from_finnhub_quote(
-        self, ticker: str, quote_data: Dict[str, Any]
+        self,
+        ticker: str,
+        quote_data: Dict[str, Any],
+        fetched_at_utc: Optional[str] = None,
     ) -> bool:
         """Convenience method to insert Finnhub quote data
 
@@ -133,6 +420,11 @@ class Database:
         - pc: Previous close price
         - t: Timestamp
 
+        Args:
+            ticker: Stock ticker symbol
+            quote_data: Finnhub quote response
+            fetched_at_utc: Optional shared fetch timestamp (ISO format)
+
         Returns:
             True if successfully inserted, False if data invalid
         """
@@ -161,6 +453,7 @@ class Database:
             adj_close=None,
             currency="USD",
             source="finnhub",
+            fetched_at_utc=fetched_at_utc,
         )
 
         return True
@@ -0,0 +1,97 @@
+"""On-disk cache of rendered chart plots, persisted across app launches"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class PlotCache:
+    """SQLite-backed LRU of plain plot strings keyed by a hash of the plot inputs
+
+    Keys hash the exact series values and plot config, so new prices give
+    new keys and stale entries simply age out. The cache is disposable:
+    any error (unwritable directory, corrupt file) disables it for the
+    session instead of failing the chart. Safe to share between the UI
+    thread and chart render workers.
+    """
+
+    MAX_ENTRIES = 200
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()  # One connection, shared across threads
+
+    @staticmethod
+    def make_key(series: tuple, config: tuple) -> str:
+        """Stable key for plot inputs (repr keeps floats exact)"""
+        return hashlib.sha1(repr((series, config)).encode()).hexdigest()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open (and create) the cache database on first use, None once disabled"""
+        if self._disabled:
+            return None
+        if self._conn is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    self.path, isolation_level=None, check_same_thread=False
+                )
+                conn.execute("PRAGMA synchronous = OFF")  # Losing the cache is harmless
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS plots ("
+                    "key TEXT PRIMARY KEY, plot TEXT NOT NULL, used_at REAL NOT NULL)"
+                )
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                self._disable()
+        return self._conn
+
+    def _disable(self) -> None:
+        """Stop using the cache for the rest of the session"""
+        self._disabled = True
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached plot for key, or None"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT plot FROM plots WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE plots SET used_at = ? WHERE key = ?", (time.time(), key))
+                return row[0]
+            except sqlite3.Error:
+                self._disable()
+                return None
+
+    def put(self, key: str, plot: str) -> None:
+        """Store plot under key, evicting least recently used beyond MAX_ENTRIES"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO plots (key, plot, used_at) VALUES (?, ?, ?)",
+                    (key, plot, time.time()),
+                )
+                conn.execute(
+                    "DELETE FROM plots WHERE key NOT IN "
+                    "(SELECT key FROM plots ORDER BY used_at DESC LIMIT ?)",
+                    (self.MAX_ENTRIES,),
+                )
+            except sqlite3.Error:
+                self._disable()
@@ -4,26 +4,192 @@ from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import Static
 from textual.containers import VerticalScroll
-from typing import Optional, List, Tuple
-import asciichartpy as acp
+from textual.timer import Timer
+from textual.worker import get_current_worker
+from typing import Optional, List, Tuple, Dict, Any
+from bisect import bisect_left
+from collections import OrderedDict, namedtuple
+from functools import lru_cache, partial
+import re
 from rich.text import Text
 
 from ..data.db import Database
-from ..data.models import DailyPrice
+from ..data.plot_cache import PlotCache
+from ..analysis.indicators import align_by_date
 from ..utils.formatting import COLOR_GAIN, COLOR_LOSS
 
+# Rendered (header, chart, stats) for one chart state
+ChartRender = Tuple[Text, Text, Text]
+
+# Close series plus the summary stats derived from it in a single pass
+_StatsBundle = namedtuple("StatsBundle", "closes start end high low")  # closes is a tuple
+
+# Plotted comparison (marks split off) plus what the UI thread needs to finish it
+_ComparisonPlot = namedtuple(
+    "ComparisonPlot", "chart marked_rows baseline mode_label closes1 closes2"
+)
+
+# Stats line templates, split where the style changes (high/low/last colored apart)
+_START_TMPL = "Start: ${:.2f} | "
+_HIGH_TMPL = "High: ${:.2f}"
+_LOW_TMPL = "Low: ${:.2f}"
+_LAST_TMPL = "Last: ${:.2f}"
+_CHANGE_TMPL = "{:+.2f} ({:+.2f}%)"
+_MOVE_TMPL = "${:.2f} → ${:.2f} "
+
+# Numeric Y-axis label as printed by asciichartpy, e.g. "  182.40" or " -1.00%"
+_YLABEL_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*%?\s*$")
+
+
+@lru_cache(maxsize=1024)
+def _label_style(y_label: str, baseline: float) -> str:
+    """Style for a Y-axis label: gain/loss vs baseline, white if unparseable"""
+    match = _YLABEL_RE.match(y_label)
+    if match is None:
+        return "white"
+    return COLOR_GAIN if float(match.group(1)) >= baseline else COLOR_LOSS
+
+
+def _plot(series: Any, config: Dict[str, Any], disk_cache: Optional[PlotCache] = None) -> str:
+    """asciichartpy.plot for one series or a list of series, memoized on the inputs
+
+    Series that are already tuples are used as the cache key without a copy.
+    """
+    if series and isinstance(series[0], (list, tuple)):
+        key = tuple(tuple(s) for s in series)
+    else:
+        key = tuple(series)
+    return _plot_cached(key, tuple(sorted(config.items())), disk_cache)
+
+
+@lru_cache(maxsize=64)
+def _plot_cached(series: tuple, config: tuple, disk_cache: Optional[PlotCache]) -> str:
+    """Plot hashable inputs, checking the on-disk cache before plotting"""
+    if disk_cache is not None:
+        disk_key = PlotCache.make_key(series, config)
+        plot = disk_cache.get(disk_key)
+        if plot is not None:
+            return plot
+
+    # Imported on first chart render rather than at app import
+    import asciichartpy
+
+    if series and isinstance(series[0], tuple):
+        data = [list(s) for s in series]
+    else:
+        data = list(series)
+    plot = asciichartpy.plot(data, dict(config))
+
+    if disk_cache is not None:
+        disk_cache.put(disk_key, plot)
+    return plot
+
+
+def extrema_downsample(series: List[float], n_out: int) -> List[float]:
+    """Reduce series to n_out points (n_out >= 3), keeping its extremes visible
+
+    M4-style: the first and last points are kept, and each interior bin
+    contributes its min or max, whichever moves further from the previous
+    output point. asciichartpy draws one column per point, so this keeps
+    one point per bin rather than M4's four.
+    """
+    n = len(series)
+    inner = n_out - 2
+    bin_size = (n - 2) / inner
+
+    prev = series[0]
+    result = [prev]
+    for b in range(inner):
+        chunk = series[1 + int(b * bin_size):1 + int((b + 1) * bin_size)]
+        low, high = min(chunk), max(chunk)
+        prev = high if high - prev >= prev - low else low
+        result.append(prev)
+    result.append(series[-1])
+    return result
+
+
+# asciichartpy wraps each cell of a colored series in color + char + reset;
+# the comparison series is plotted with this marker so one plot shows both
+_CMP_MARK = "\x1b[36m"
+_CMP_RESET = "\x1b[0m"
+
+
+def split_marked_plot(plot: str) -> Tuple[str, List[List[int]]]:
+    """Strip comparison markers from plot, returning (plain plot, marked columns per row)"""
+    if _CMP_MARK not in plot:
+        return plot, []
+
+    plain_lines: List[str] = []
+    marked_rows: List[List[int]] = []
+    skip = len(_CMP_RESET) + 1  # marked char plus the reset that follows it
+    for line in plot.split("\n"):
+        segments = line.split(_CMP_MARK)
+        plain = [segments[0]]
+        width = len(segments[0])
+        marked: List[int] = []
+        for segment in segments[1:]:
+            marked.append(width)
+            plain.append(segment[0])
+            plain.append(segment[skip:])
+            width += 1 + len(segment) - skip
+        plain_lines.append("".join(plain))
+        marked_rows.append(marked)
+    return "\n".join(plain_lines), marked_rows
+
+
+def relative_pcts(closes: List[float]) -> List[float]:
+    """Normalize closes to % change from the first (non-zero) close"""
+    # Hoist the reciprocal so each point is one subtract + multiply
+    start = closes[0]
+    scale = 100.0 / start
+    return [(price - start) * scale for price in closes]
+
 
 class ChartPanel(Widget):
     """Chart display with absolute/relative modes"""
 
-    def __init__(self, db: Database, height: int = 15, initial_day_range: int = 120, **kwargs) -> None:
+    RENDER_DELAY = 0.04  # Seconds to coalesce key-repeat bursts into one render
+    RENDER_CACHE_SIZE = 32  # Rendered chart states kept for instant revisits
+    YAXIS_WIDTH = 10  # Columns taken by the Y-axis label and "┤" left of the plot
+    COLOR_CACHE_SIZE = 8  # Y-axis colored charts kept for identical plot output
+    HEADER_CACHE_SIZE = 64  # Header Texts kept (tickers x modes x ranges)
+
+    def __init__(
+        self,
+        db: Database,
+        height: int = 15,
+        initial_day_range: int = 120,
+        plot_cache: Optional[PlotCache] = None,
+        **kwargs
+    ) -> None:
         super().__init__(**kwargs)
         self.db = db
+        self.plot_cache = plot_cache  # Optional on-disk plots shared across launches
         self.chart_height = height
+        # asciichartpy configs, built once; comparison plots add min/max per call
+        self._abs_plot_config = {"height": height, "format": "{:8.2f}"}
+        self._rel_plot_config = {"height": height, "format": "{:6.2f}%"}
         self.current_ticker: Optional[str] = None
         self.current_range: int = initial_day_range  # Set from app
         self.chart_mode: str = "absolute"  # "absolute" or "relative"
         self.comparison_ticker: Optional[str] = None  # Ticker marked for comparison
+        self._render_timer: Optional[Timer] = None  # Pending debounced render
+        self._last_render_key: Optional[tuple] = None  # State of the last render
+        # LRU of rendered charts keyed by (ticker, range, mode, comparison, db version, width)
+        self._chart_cache: "OrderedDict[tuple, ChartRender]" = OrderedDict()
+        # LRU of Y-axis colored charts keyed by (plot output, baseline)
+        self._color_cache: "OrderedDict[Tuple[str, float], Text]" = OrderedDict()
+        # LRU of header Texts keyed by title (ticker(s), mode label and range)
+        self._header_cache: "OrderedDict[str, Text]" = OrderedDict()
+        # Stats from the last single-ticker render, reused as-is on a mode toggle
+        self._last_stats_key: Optional[Tuple[str, int]] = None
+        self._last_stats: Optional[_StatsBundle] = None
+        self._force_reload: bool = True
+        # Child Statics, resolved once on mount instead of queried per render
+        self._header_widget: Optional[Static] = None
+        self._display_widget: Optional[Static] = None
+        self._stats_widget: Optional[Static] = None
+        db.on_update(self._on_db_update)
 
     def compose(self) -> ComposeResult:
         """Compose chart display"""
@@ -32,65 +198,189 @@ class ChartPanel(Widget):
             yield Static("Select a ticker to view chart", id="chart_display")
             yield Static("", id="chart_stats")
 
+    def on_mount(self) -> None:
+        """Look up the chart Statics once"""
+        self._header_widget = self.query_one("#chart_header", Static)
+        self._display_widget = self.query_one("#chart_display", Static)
+        self._stats_widget = self.query_one("#chart_stats", Static)
+
+    def on_resize(self) -> None:
+        """Re-plot so the chart fits the new width"""
+        if self.current_ticker:
+            self.schedule_render()
+
     def update_ticker(self, ticker: str, day_range: Optional[int] = None) -> None:
         """Update chart for new ticker"""
         self.current_ticker = ticker
         if day_range is not None:
             self.current_range = day_range
-        self.render_chart()
+        self._force_reload = True
+        self.schedule_render()
 
     def update_range(self, day_range: int) -> None:
         """Update day range"""
         self.current_range = day_range
+        self._force_reload = True
         if self.current_ticker:
-            self.render_chart()
+            self.schedule_render()
 
     def update_comparison(self, ticker: Optional[str]) -> None:
         """Update comparison ticker (None to disable comparison)"""
         self.comparison_ticker = ticker
-        self.render_chart()
+        self.schedule_render()
 
     def toggle_mode(self) -> None:
         """Toggle between absolute and relative chart modes"""
         self.chart_mode = "relative" if self.chart_mode == "absolute" else "absolute"
+        self._force_reload = False  # Same ticker and range, only the plot changes
         if self.current_ticker:
-            self.render_chart()
+            self.schedule_render()
+
+    def _on_db_update(self, ticker: str) -> None:
+        """Database listener; may run on a worker thread, so hop to our queue"""
+        self.call_later(self.invalidate, ticker)
+
+    def invalidate(self, ticker: Optional[str] = None) -> None:
+        """Drop cached charts for ticker (or all tickers) after a price update
+
+        Re-renders if the ticker is on screen: a render that ran between the
+        write and this call may have shown (and keyed) pre-write prices.
+        """
+        self._last_stats_key = None
+        if ticker is None:
+            self._chart_cache.clear()
+        else:
+            # Render keys are (ticker, range, mode, comparison, db version, width)
+            for key in [k for k in list(self._chart_cache) if ticker in (k[0], k[3])]:
+                del self._chart_cache[key]
+
+        if self.current_ticker and ticker in (None, self.current_ticker, self.comparison_ticker):
+            self._last_render_key = None
+            self.schedule_render()
+
+    def _get_columns(self, ticker: str, days: int) -> Tuple[List[str], List[float]]:
+        """(dates, closes) for ticker, served from the database read cache"""
+        return self.db.get_daily_closes(ticker, days)
+
+    def _get_stats(self, ticker: str, days: int) -> Optional[_StatsBundle]:
+        """Fetch closes and compute their stats in one pass (None if < 2 points)"""
+        # Frozen once here so every plot of this series reuses it as its key
+        closes = tuple(self.db.get_closing_prices(ticker, days))
+        if len(closes) < 2:
+            return None
+
+        high = low = closes[0]
+        for close in closes:
+            if close > high:
+                high = close
+            elif close < low:
+                low = close
+        return _StatsBundle(closes, closes[0], closes[-1], high, low)
+
+    def schedule_render(self) -> None:
+        """Schedule a render, coalescing bursts of updates (e.g. key repeat)"""
+        if self._render_timer is not None:
+            self._render_timer.stop()
+        self._render_timer = self.set_timer(self.RENDER_DELAY, self.render_chart)
 
     def render_chart(self) -> None:
         """Render the chart for current ticker and settings"""
         if not self.current_ticker:
             return
 
+        # Skip if nothing that affects the chart has changed since last render
+        render_key = (
+            self.current_ticker,
+            self.current_range,
+            self.chart_mode,
+            self.comparison_ticker,
+            self.db.version,
+            self.content_size.width,  # Plots are downsampled to fit the width
+        )
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+
+        # Revisiting a recent state (e.g. toggling mode back) is a cache hit.
+        # The db version in the key retires entries once new prices arrive.
+        rendered = self._chart_cache.get(render_key)
+        if rendered is not None:
+            self._chart_cache.move_to_end(render_key)
+            self.show_render(rendered)
+            return
+
         # Show comparison only if:
         # 1. There's a comparison ticker marked
         # 2. It's different from the current ticker
         if self.comparison_ticker and self.comparison_ticker != self.current_ticker:
-            self.render_comparison_chart()
+            # Two fetches plus the widest plot: build it off the UI thread.
+            # exclusive=True supersedes any comparison still in flight.
+            self.run_worker(
+                partial(self._render_comparison_worker, render_key),
+                thread=True,
+                exclusive=True,
+                group="chart_render",
+            )
             return
 
+        self.finish_render(render_key, self.render_single_chart())
+
+    def _render_comparison_worker(self, render_key: tuple) -> None:
+        """Plot a comparison chart on a worker thread and finish it on the UI thread"""
+        ticker, day_range, mode, comparison_ticker = render_key[:4]
+        # Database reads are thread-safe; widget caches stay on the UI thread
+        plotted = self.plot_comparison(
+            self._get_columns(ticker, day_range),
+            self._get_columns(comparison_ticker, day_range),
+            mode,
+        )
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._finish_comparison, render_key, plotted)
+
+    def _finish_comparison(self, render_key: tuple, plotted: Any) -> None:
+        """Color and label a worker's comparison plot, then cache and show it"""
+        ticker, day_range, _, comparison_ticker = render_key[:4]
+        rendered = self.render_comparison_chart(ticker, comparison_ticker, day_range, plotted)
+        self.finish_render(render_key, rendered)
+
+    def finish_render(self, render_key: tuple, rendered: ChartRender) -> None:
+        """Cache a freshly built chart and show it if its state is still current"""
+        self._chart_cache[render_key] = rendered
+        if len(self._chart_cache) > self.RENDER_CACHE_SIZE:
+            self._chart_cache.popitem(last=False)
+        if render_key == self._last_render_key:
+            self.show_render(rendered)
+
+    def show_render(self, rendered: ChartRender) -> None:
+        """Push a rendered (header, chart, stats) triple to the Statics"""
+        header_text, chart_display, stats_text = rendered
+        self._header_widget.update(header_text)
+        self._display_widget.update(chart_display)
+        self._stats_widget.update(stats_text)
+
+    def render_single_chart(self) -> ChartRender:
+        """Build header, chart and stats for the current ticker alone"""
         # Single ticker mode
         # Either no comparison ticker, or we're viewing the marked ticker itself
         # Check if we're viewing the marked ticker (should be shown in blue)
         is_marked_ticker = (self.current_ticker == self.comparison_ticker)
 
-        # Fetch price data
-        prices = self.db.get_daily_prices(self.current_ticker, self.current_range)
-
-        if not prices or len(prices) < 2:
-            self.query_one("#chart_header", Static).update("")
-            self.query_one("#chart_display", Static).update(
-                f"Insufficient data for {self.current_ticker}"
-            )
-            self.query_one("#chart_stats", Static).update("")
-            return
-
-        closes = [p.close for p in prices]
-
-        # Calculate price stats
-        start_price = closes[0]
-        end_price = closes[-1]
-        high_price = max(closes)
-        low_price = min(closes)
+        # Fetch closing prices and their stats (single ticker mode only needs closes)
+        stats_key = (self.current_ticker, self.current_range)
+        if self._force_reload or stats_key != self._last_stats_key:
+            self._last_stats = self._get_stats(self.current_ticker, self.current_range)
+            self._last_stats_key = stats_key
+            self._force_reload = False
+        stats = self._last_stats
+
+        if stats is None:
+            return Text(), Text(f"Insufficient data for {self.current_ticker}"), Text()
+
+        closes = stats.closes
+        start_price = stats.start
+        end_price = stats.end
+        high_price = stats.high
+        low_price = stats.low
         change = end_price - start_price
         change_pct = (change / start_price) * 100 if start_price != 0 else 0
 
@@ -111,18 +401,14 @@ class ChartPanel(Widget):
             mode_label = "Relative % Change"
 
             # Color Y-axis labels based on 0% baseline for relative mode
-            chart_display = self.color_yaxis_by_baseline_percent(chart_str, 0.0)
+            chart_display = self.color_yaxis_by_baseline(chart_str, 0.0)
 
         # If viewing the marked comparison ticker, color its line blue
         if is_marked_ticker:
             chart_display = self.color_single_line_blue(chart_display)
 
         # Build header (above chart)
-        header_text = Text()
-        header_text.append(
-            f"{self.current_ticker} - {mode_label} ({self.current_range}d)",
-            style="bold bright_white"
-        )
+        header_text = self.header_text(f"{self.current_ticker} - {mode_label} ({self.current_range}d)")
 
         # Build stats (below chart)
         # Color high, low, and last based on comparison to start
@@ -132,28 +418,52 @@ class ChartPanel(Widget):
 
         stats_text = Text()
         stats_text.append(f"{arrow} ", style=color)
-        stats_text.append(f"Start: ${start_price:.2f} | ", style="white")
-        stats_text.append(f"High: ${high_price:.2f}", style=high_color)
+        stats_text.append(_START_TMPL.format(start_price), style="white")
+        stats_text.append(_HIGH_TMPL.format(high_price), style=high_color)
         stats_text.append(" | ", style="white")
-        stats_text.append(f"Low: ${low_price:.2f}", style=low_color)
+        stats_text.append(_LOW_TMPL.format(low_price), style=low_color)
         stats_text.append(" | ", style="white")
-        stats_text.append(f"Last: ${end_price:.2f}", style=last_color)
+        stats_text.append(_LAST_TMPL.format(end_price), style=last_color)
         stats_text.append(" | ", style="white")
-        stats_text.append(f"Change: {change:+.2f} ({change_pct:+.2f}%)", style=color)
-
-        # Update display
-        self.query_one("#chart_header", Static).update(header_text)
-        self.query_one("#chart_display", Static).update(chart_display)
-        self.query_one("#chart_stats", Static).update(stats_text)
+        stats_text.append("Change: " + _CHANGE_TMPL.format(change, change_pct), style=color)
+
+        return header_text, chart_display, stats_text
+
+    def header_text(self, title: str) -> Text:
+        """Styled header for title, reused while ticker, mode and range are unchanged"""
+        header = self._header_cache.get(title)
+        if header is not None:
+            self._header_cache.move_to_end(title)
+            return header
+
+        header = Text()
+        header.append(title, style="bold bright_white")
+        self._header_cache[title] = header
+        if len(self._header_cache) > self.HEADER_CACHE_SIZE:
+            self._header_cache.popitem(last=False)
+        return header
+
+    def plot(self, series: Any, config: Dict[str, Any]) -> str:
+        """Plot via the in-memory and (if configured) on-disk plot caches"""
+        return _plot(series, config, self.plot_cache)
+
+    def fit_to_width(self, series: List[float]) -> List[float]:
+        """Downsample series to one point per available plot column
+
+        asciichartpy draws one column per point, so points beyond the panel
+        width only cost plot time (and wrap the chart). Peaks and troughs
+        survive (see extrema_downsample). Returns series unchanged before
+        layout or when it fits.
+        """
+        cols = self.content_size.width - self.YAXIS_WIDTH
+        if cols < 3 or len(series) <= cols:
+            return series
+        return extrema_downsample(series, cols)
 
     def render_absolute_chart(self, closes: list[float]) -> str:
         """Render absolute price chart"""
         try:
-            config = {
-                "height": self.chart_height,
-                "format": "{:8.2f}",
-            }
-            return acp.plot(closes, config)
+            return self.plot(self.fit_to_width(closes), self._abs_plot_config)
         except Exception as e:
             return f"Error rendering chart: {e}"
 
@@ -164,237 +474,145 @@ class ChartPanel(Widget):
 
         try:
             # Normalize to % change from first price
-            start_price = closes[0]
-            relative_pcts = [
-                ((price - start_price) / start_price) * 100 for price in closes
-            ]
-
-            config = {
-                "height": self.chart_height,
-                "format": "{:6.2f}%",
-            }
-            return acp.plot(relative_pcts, config)
+            return self.plot(self.fit_to_width(relative_pcts(closes)), self._rel_plot_config)
         except Exception as e:
             return f"Error rendering chart: {e}"
 
-    def color_yaxis_by_baseline(self, chart_str: str, baseline_price: float) -> Text:
-        """Color Y-axis labels green if >= baseline, red if < baseline"""
-        result = Text()
-        lines = chart_str.split("\n")
-
-        for line in lines:
-            if "┤" in line:
-                # Split Y-axis label from chart
-                parts = line.split("┤", 1)
-                y_label = parts[0]
-                chart_part = "┤" + parts[1] if len(parts) > 1 else ""
-
-                # Try to extract price from Y-axis label
-                try:
-                    # Remove whitespace and extract number
-                    price_str = y_label.strip()
-                    price = float(price_str)
-
-                    # Color based on baseline
-                    if price >= baseline_price:
-                        result.append(y_label, style=COLOR_GAIN)
-                    else:
-                        result.append(y_label, style=COLOR_LOSS)
-                except (ValueError, AttributeError):
-                    # If can't parse price, use default color
-                    result.append(y_label, style="white")
-
-                # Add chart part in white
-                result.append(chart_part, style="white")
-            else:
-                # No Y-axis on this line, just append as is
-                result.append(line, style="white")
-
-            result.append("\n")
-
-        return result
-
-    def color_yaxis_by_baseline_percent(self, chart_str: str, baseline_pct: float) -> Text:
-        """Color Y-axis percent labels green if >= baseline, red if < baseline"""
-        result = Text()
-        lines = chart_str.split("\n")
-
-        for line in lines:
-            if "┤" in line:
-                # Split Y-axis label from chart
-                parts = line.split("┤", 1)
-                y_label = parts[0]
-                chart_part = "┤" + parts[1] if len(parts) > 1 else ""
-
-                # Extract percentage from Y-axis label
-                # Format from asciichartpy is like "  8.32%" or " -1.00%"
-                pct_str = y_label.strip().replace("%", "").strip()
-
-                if pct_str:  # Only process non-empty labels
-                    try:
-                        # Remove any non-numeric chars except minus and decimal
-                        pct_str_clean = ''.join(c for c in pct_str if c.isdigit() or c in '.-')
-                        pct = float(pct_str_clean)
-
-                        # Color based on baseline (0%)
-                        if pct >= baseline_pct:
-                            result.append(y_label, style=COLOR_GAIN)
-                        else:
-                            result.append(y_label, style=COLOR_LOSS)
-                    except (ValueError, AttributeError):
-                        # If parsing somehow fails, keep white
-                        result.append(y_label, style="white")
-                else:
-                    # Empty label, keep white
-                    result.append(y_label, style="white")
-
-                # Add chart part in white
-                result.append(chart_part, style="white")
-            else:
+    def color_yaxis_by_baseline(self, chart_str: str, baseline: float) -> Text:
+        """Color Y-axis labels (prices or percents) green if >= baseline, red if < baseline"""
+        # Identical plot output colors identically; skip the pass entirely
+        key = (chart_str, baseline)
+        cached = self._color_cache.get(key)
+        if cached is not None:
+            self._color_cache.move_to_end(key)
+            return cached
+
+        # Collect (segment, style) pairs and build the Text once at the end
+        spans: List[Tuple[str, str]] = []
+        append = spans.append
+
+        # keepends preserves each "\n"; the extra one keeps the trailing newline
+        for line in (chart_str + "\n").splitlines(keepends=True):
+            y_label, sep, chart_part = line.partition("┤")
+            if not sep:
                 # No Y-axis on this line, just append as is
-                result.append(line, style="white")
+                append((line, "white"))
+                continue
 
-            result.append("\n")
+            # Color the Y-axis label vs baseline, chart part in white
+            append((y_label, _label_style(y_label, baseline)))
+            append((sep + chart_part, "white"))
 
+        result = Text.assemble(*spans)
+        self._color_cache[key] = result
+        if len(self._color_cache) > self.COLOR_CACHE_SIZE:
+            self._color_cache.popitem(last=False)
         return result
 
-    def render_comparison_chart(self) -> None:
-        """Render chart comparing two tickers"""
-        # Fetch data for both tickers
-        prices1 = self.db.get_daily_prices(self.current_ticker, self.current_range)
-        prices2 = self.db.get_daily_prices(self.comparison_ticker, self.current_range)
-
-        if not prices1 or not prices2:
-            self.query_one("#chart_header", Static).update("")
-            self.query_one("#chart_display", Static).update(
-                "Insufficient data for comparison"
-            )
-            self.query_one("#chart_stats", Static).update("")
-            return
+    def plot_comparison(
+        self,
+        columns1: Tuple[List[str], List[float]],
+        columns2: Tuple[List[str], List[float]],
+        mode: str,
+    ) -> Any:
+        """Plot two tickers' (dates, closes) columns on shared axes
+
+        Runs on a worker thread, so it only plots: no widget caches are
+        touched. Returns a _ComparisonPlot, or a message string when there
+        is nothing to plot.
+        """
+        dates1, all_closes1 = columns1
+        dates2, all_closes2 = columns2
+
+        if not dates1 or not dates2:
+            return "Insufficient data for comparison"
 
         # Align to common dates
-        aligned1, aligned2 = self.align_price_series(prices1, prices2)
-
-        if not aligned1:
-            self.query_one("#chart_header", Static).update("")
-            self.query_one("#chart_display", Static).update(
-                "No overlapping dates for comparison"
-            )
-            self.query_one("#chart_stats", Static).update("")
-            return
+        closes1, closes2 = align_by_date(dates1, all_closes1, dates2, all_closes2)
 
-        closes1 = [p.close for p in aligned1]
-        closes2 = [p.close for p in aligned2]
+        if not closes1:
+            return "No overlapping dates for comparison"
 
         # Render based on mode
-        if self.chart_mode == "absolute":
-            # Calculate Y-axis range for both series combined
-            all_values = closes1 + closes2
-            y_min = min(all_values)
-            y_max = max(all_values)
+        if mode == "absolute":
+            # Calculate Y-axis range for both series combined (no concatenated copy)
+            y_min = min(min(closes1), min(closes2))
+            y_max = max(max(closes1), max(closes2))
 
             chart_str = self.render_absolute_comparison(closes1, closes2, y_min, y_max)
-            comparison_only = self.render_absolute_single(closes2, y_min, y_max)
             mode_label = "Absolute Price"
-            chart_display = self.color_yaxis_by_baseline(chart_str, closes1[0])
-            # Color the comparison line in cyan
-            chart_display = self.color_comparison_line(chart_display, comparison_only)
+            baseline = closes1[0]
         else:
-            # Normalize both series
-            start1 = closes1[0]
-            relative_pcts1 = [((p - start1) / start1) * 100 for p in closes1]
-            start2 = closes2[0]
-            relative_pcts2 = [((p - start2) / start2) * 100 for p in closes2]
+            if closes1[0] == 0 or closes2[0] == 0:
+                return "No data"
+
+            # Normalize both series once; the plots below reuse them
+            pcts1 = relative_pcts(closes1)
+            pcts2 = relative_pcts(closes2)
 
             # Calculate Y-axis range for both series combined
-            all_pcts = relative_pcts1 + relative_pcts2
-            y_min = min(all_pcts)
-            y_max = max(all_pcts)
+            y_min = min(min(pcts1), min(pcts2))
+            y_max = max(max(pcts1), max(pcts2))
 
-            chart_str = self.render_relative_comparison(closes1, closes2, y_min, y_max)
-            comparison_only = self.render_relative_single(relative_pcts2, y_min, y_max)
+            chart_str = self.render_relative_comparison(pcts1, pcts2, y_min, y_max)
             mode_label = "Relative % Change"
-            chart_display = self.color_yaxis_by_baseline_percent(chart_str, 0.0)
-            # Color the comparison line in cyan
-            chart_display = self.color_comparison_line(chart_display, comparison_only)
-
-        # Update header
-        header_text = Text()
-        header_text.append(
-            f"{self.current_ticker} vs {self.comparison_ticker} - {mode_label} ({self.current_range}d)",
-            style="bold bright_white"
+            baseline = 0.0
+
+        # One plot carries both lines; the comparison line's cells are marked
+        chart_str, marked_rows = split_marked_plot(chart_str)
+        return _ComparisonPlot(chart_str, marked_rows, baseline, mode_label, closes1, closes2)
+
+    def render_comparison_chart(
+        self, ticker: str, comparison_ticker: str, day_range: int, plotted: Any
+    ) -> ChartRender:
+        """Build header, chart and stats from plot_comparison's result
+
+        Takes the chart state explicitly (rather than reading it from self)
+        since the UI may have moved on while the plot was built.
+        """
+        if isinstance(plotted, str):
+            return Text(), Text(plotted), Text()
+
+        # Color Y-axis labels vs baseline and the comparison line in cyan
+        chart_display = self.color_comparison_chart(
+            plotted.chart, plotted.baseline, plotted.marked_rows
+        )
+
+        # Build header
+        header_text = self.header_text(
+            f"{ticker} vs {comparison_ticker} - {plotted.mode_label} ({day_range}d)"
         )
-        self.query_one("#chart_header", Static).update(header_text)
 
-        # Update chart
-        self.query_one("#chart_display", Static).update(chart_display)
+        # Build stats (both tickers)
+        stats_text = self.render_comparison_stats(
+            ticker, comparison_ticker, plotted.closes1, plotted.closes2
+        )
 
-        # Update stats (both tickers)
-        self.update_comparison_stats(aligned1, aligned2, closes1, closes2)
+        return header_text, chart_display, stats_text
 
     def render_absolute_comparison(self, closes1: list[float], closes2: list[float], y_min: float, y_max: float) -> str:
-        """Render absolute price chart for two tickers with explicit Y-axis range"""
+        """Render absolute price chart for two tickers (second one marked) with explicit Y-axis range"""
         try:
-            config = {
-                "height": self.chart_height,
-                "format": "{:8.2f}",
-                "min": y_min,
-                "max": y_max,
-            }
-            return acp.plot([closes1, closes2], config)
+            config = dict(self._abs_plot_config, min=y_min, max=y_max, colors=(None, _CMP_MARK))
+            return self.plot([self.fit_to_width(closes1), self.fit_to_width(closes2)], config)
         except Exception as e:
             return f"Error: {e}"
 
-    def render_relative_comparison(self, closes1: list[float], closes2: list[float], y_min: float, y_max: float) -> str:
-        """Render relative % change chart for two tickers with explicit Y-axis range"""
-        if not closes1 or not closes2 or closes1[0] == 0 or closes2[0] == 0:
+    def render_relative_comparison(self, pcts1: list[float], pcts2: list[float], y_min: float, y_max: float) -> str:
+        """Render relative % change chart for two normalized series (second one marked)"""
+        if not pcts1 or not pcts2:
             return "No data"
 
         try:
-            # Normalize both to % change from their own first price
-            start1 = closes1[0]
-            relative_pcts1 = [((p - start1) / start1) * 100 for p in closes1]
-
-            start2 = closes2[0]
-            relative_pcts2 = [((p - start2) / start2) * 100 for p in closes2]
-
-            config = {
-                "height": self.chart_height,
-                "format": "{:6.2f}%",
-                "min": y_min,
-                "max": y_max,
-            }
-            return acp.plot([relative_pcts1, relative_pcts2], config)
+            config = dict(self._rel_plot_config, min=y_min, max=y_max, colors=(None, _CMP_MARK))
+            return self.plot([self.fit_to_width(pcts1), self.fit_to_width(pcts2)], config)
         except Exception as e:
             return f"Error: {e}"
 
-    def align_price_series(
-        self,
-        prices1: List[DailyPrice],
-        prices2: List[DailyPrice]
-    ) -> Tuple[List[DailyPrice], List[DailyPrice]]:
-        """Align two price series by date, returning only common dates"""
-        # Create date -> price mappings
-        map1 = {p.trade_date: p for p in prices1}
-        map2 = {p.trade_date: p for p in prices2}
-
-        # Find common dates
-        common_dates = sorted(set(map1.keys()) & set(map2.keys()))
-
-        # Return aligned lists
-        aligned1 = [map1[d] for d in common_dates]
-        aligned2 = [map2[d] for d in common_dates]
-
-        return aligned1, aligned2
-
-    def update_comparison_stats(
-        self,
-        aligned1: List[DailyPrice],
-        aligned2: List[DailyPrice],
-        closes1: list[float],
-        closes2: list[float]
-    ) -> None:
-        """Update stats section for comparison mode"""
+    def render_comparison_stats(
+        self, ticker: str, comparison_ticker: str, closes1: list[float], closes2: list[float]
+    ) -> Text:
+        """Build stats section for comparison mode"""
         stats_text = Text()
 
         # Ticker 1 stats
@@ -405,9 +623,9 @@ class ChartPanel(Widget):
         arrow1 = "▲" if change1 >= 0 else "▼"
 
         stats_text.append(f"{arrow1} ", style=color1)
-        stats_text.append(f"{self.current_ticker}: ", style="bold white")
-        stats_text.append(f"${start1:.2f} → ${end1:.2f} ", style="white")
-        stats_text.append(f"{change1:+.2f} ({change_pct1:+.2f}%)", style=color1)
+        stats_text.append(f"{ticker}: ", style="bold white")
+        stats_text.append(_MOVE_TMPL.format(start1, end1), style="white")
+        stats_text.append(_CHANGE_TMPL.format(change1, change_pct1), style=color1)
         stats_text.append("\n")
 
         # Ticker 2 stats
@@ -418,109 +636,73 @@ class ChartPanel(Widget):
         arrow2 = "▲" if change2 >= 0 else "▼"
 
         stats_text.append(f"{arrow2} ", style=color2)
-        stats_text.append(f"{self.comparison_ticker}: ", style="bold cyan")
-        stats_text.append(f"${start2:.2f} → ${end2:.2f} ", style="white")
-        stats_text.append(f"{change2:+.2f} ({change_pct2:+.2f}%)", style=color2)
+        stats_text.append(f"{comparison_ticker}: ", style="bold cyan")
+        stats_text.append(_MOVE_TMPL.format(start2, end2), style="white")
+        stats_text.append(_CHANGE_TMPL.format(change2, change_pct2), style=color2)
+
+        return stats_text
+
+    @staticmethod
+    def _sorted_spans(text: Text) -> Tuple[list, List[int]]:
+        """Spans of text ordered by start, plus their starts for bisecting"""
+        spans = sorted(text._spans, key=lambda span: span.start)
+        return spans, [span.start for span in spans]
+
+    @staticmethod
+    def _yaxis_style(spans: list, span_starts: List[int], line_start: int, y_axis_end: int) -> Any:
+        """Style of the first span starting inside a line's Y-axis label (white if none)"""
+        k = bisect_left(span_starts, line_start)
+        if k < len(spans) and span_starts[k] < line_start + y_axis_end:
+            return spans[k].style
+        return "white"
+
+    def color_comparison_chart(
+        self, chart_str: str, baseline: float, marked_rows: List[List[int]]
+    ) -> Text:
+        """Color a comparison plot in one pass over its lines
+
+        Y-axis labels are colored vs baseline (as color_yaxis_by_baseline),
+        cells of the comparison line (marked_rows) cyan, everything else white.
+        """
+        if not marked_rows:
+            return self.color_yaxis_by_baseline(chart_str, baseline)
 
-        self.query_one("#chart_stats", Static).update(stats_text)
-
-    def render_absolute_single(self, closes: list[float], y_min: float, y_max: float) -> str:
-        """Render absolute price chart for single ticker with explicit Y-axis range"""
-        try:
-            config = {
-                "height": self.chart_height,
-                "format": "{:8.2f}",
-                "min": y_min,
-                "max": y_max,
-            }
-            return acp.plot(closes, config)
-        except Exception:
-            return ""
-
-    def render_relative_single(self, relative_pcts: list[float], y_min: float, y_max: float) -> str:
-        """Render relative % chart for single ticker with explicit Y-axis range"""
-        try:
-            config = {
-                "height": self.chart_height,
-                "format": "{:6.2f}%",
-                "min": y_min,
-                "max": y_max,
-            }
-            return acp.plot(relative_pcts, config)
-        except Exception:
-            return ""
-
-    def color_comparison_line(self, chart_display: Text, comparison_only: str) -> Text:
-        """Color the comparison ticker's line in cyan by comparing chart outputs"""
-        if not comparison_only:
-            return chart_display
-
-        # Get the plain text from chart_display to work with
-        display_str = chart_display.plain
-
-        # Split both charts into lines
-        display_lines = display_str.split("\n")
-        comparison_lines = comparison_only.split("\n")
-
-        # Build new colored output preserving y-axis colors
         result = Text()
-
-        # Extract the spans (styled segments) from original chart_display
-        # We'll preserve y-axis colors and add line colors
-        line_start = 0
-        for i, display_line in enumerate(display_lines):
-            if i >= len(comparison_lines):
-                # No comparison line for this row, keep original styling
-                line_end = line_start + len(display_line)
-                for span in chart_display._spans:
-                    if span.start >= line_start and span.end <= line_end + 1:  # +1 for \n
-                        start = span.start - line_start
-                        end = span.end - line_start
-                        if end > start:
-                            result.append(display_line[start:end], style=span.style)
-                result.append("\n")
-                line_start = line_end + 1
-                continue
-
-            comp_line = comparison_lines[i]
-
-            # Process character by character
-            if "┤" in display_line:
-                # Split at the axis separator
-                parts = display_line.split("┤", 1)
-                y_axis = parts[0]
-                chart_part = parts[1] if len(parts) > 1 else ""
-
-                # Find and preserve y-axis color from original
-                y_axis_end = len(y_axis)
-                y_axis_color = "white"
-                for span in chart_display._spans:
-                    span_start_in_line = span.start - line_start
-                    if 0 <= span_start_in_line < y_axis_end:
-                        y_axis_color = span.style
-                        break
-
-                result.append(y_axis, style=y_axis_color)
-                result.append("┤", style="white")
-
-                # Split comparison line similarly
-                comp_parts = comp_line.split("┤", 1)
-                comp_chart = comp_parts[1] if len(comp_parts) > 1 else ""
-
-                # Color chart characters
-                for j, char in enumerate(chart_part):
-                    if j < len(comp_chart) and comp_chart[j] != ' ' and char == comp_chart[j]:
-                        # This character belongs to comparison line - color it cyan
-                        result.append(char, style="#00ffff")
-                    else:
-                        # This character belongs to current ticker or is empty - keep white
-                        result.append(char, style="white")
+        append = result.append
+        for line, columns in zip(chart_str.split("\n"), marked_rows):
+            y_axis, sep, chart_part = line.partition("┤")
+            if sep:
+                append(y_axis, style=_label_style(y_axis, baseline))
+                append("┤", style="white")
+
+                # Color chart characters, appending runs of the same style at once:
+                # cyan where the cell belongs to the comparison line, white otherwise
+                chart_offset = len(y_axis) + 1  # Marked columns count from line start
+                pos = 0
+                k = 0
+                while k < len(columns):
+                    # Extend the cyan run over consecutive marked columns
+                    start = columns[k] - chart_offset
+                    end = start + 1
+                    k += 1
+                    while k < len(columns) and columns[k] - chart_offset == end:
+                        end += 1
+                        k += 1
+                    start = max(start, pos)
+                    if end <= start:
+                        continue
+                    if start > pos:
+                        append(chart_part[pos:start], style="white")
+                    append(chart_part[start:end], style="#00ffff")
+                    pos = end
+                if pos < len(chart_part):
+                    append(chart_part[pos:], style="white")
             else:
                 # No axis on this line, keep white
-                result.append(display_line, style="white")
+                append(line, style="white")
 
-            result.append("\n")
-            line_start += len(display_line) + 1  # +1 for \n
+            append("\n")
+        append("\n")
 
         return result
 
@@ -528,27 +710,19 @@ class ChartPanel(Widget):
         """Color the chart line blue for marked comparison ticker"""
         # Get the plain text from chart_display
         display_str = chart_display.plain
-        display_lines = display_str.split("\n")
 
         # Build new output with blue chart lines
         result = Text()
+        spans, span_starts = self._sorted_spans(chart_display)
 
+        # Newlines ride along on each line (the extra one keeps the trailing row)
         line_start = 0
-        for i, display_line in enumerate(display_lines):
-            if "┤" in display_line:
-                # Split at the axis separator
-                parts = display_line.split("┤", 1)
-                y_axis = parts[0]
-                chart_part = parts[1] if len(parts) > 1 else ""
-
+        for display_line in (display_str + "\n").splitlines(keepends=True):
+            # Split at the axis separator
+            y_axis, sep, chart_part = display_line.partition("┤")
+            if sep:
                 # Preserve y-axis color from original
-                y_axis_end = len(y_axis)
-                y_axis_color = "white"
-                for span in chart_display._spans:
-                    span_start_in_line = span.start - line_start
-                    if 0 <= span_start_in_line < y_axis_end:
-                        y_axis_color = span.style
-                        break
+                y_axis_color = self._yaxis_style(spans, span_starts, line_start, len(y_axis))
 
                 result.append(y_axis, style=y_axis_color)
                 result.append("┤", style="white")
@@ -559,7 +733,6 @@ class ChartPanel(Widget):
                 # No axis on this line
                 result.append(display_line, style="white")
 
-            result.append("\n")
-            line_start += len(display_line) + 1  # +1 for \n
+            line_start += len(display_line)
 
         return result
@@ -4,10 +4,15 @@ from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widget import Widget
 from textual.widgets import Static
-from typing import Optional
+from typing import Optional, Tuple, Dict
 
 from ..data.db import Database
-from ..utils.formatting import format_price, format_change_pct, get_arrow
+from ..data.models import DailyPrice
+from ..utils.formatting import format_price, format_change_pct
+
+# Indexed by sign(change) + 1: falling, flat, rising (arrows match get_arrow)
+_CHANGE_CLASSES = ("loss", "neutral", "gain")
+_CHANGE_ARROWS = ("▼", "→", "▲")
 
 
 class MarketIndices(Widget):
@@ -18,12 +23,17 @@ class MarketIndices(Widget):
         self.db = db
         self.indices = indices
         self.day_range = 90
+        # Last (content, color class) shown per index, to skip no-op repaints
+        self._last_content: Dict[str, Tuple[str, Optional[str]]] = {}
+        # Index cells by ticker, resolved on first update instead of per update
+        self._cells: Dict[str, Static] = {}
+        self._range_display = Static("Range: 90d", id="range_display", classes="range_cell")
 
     def compose(self) -> ComposeResult:
         """Compose banner display"""
         with Horizontal(id="indices_container"):
             yield Static("🧊 ICEBERG TERMINAL", id="app_title", classes="title_cell")
-            yield Static("Range: 90d", id="range_display", classes="range_cell")
+            yield self._range_display
 
     def on_mount(self) -> None:
         """Initialize banner on mount"""
@@ -32,14 +42,27 @@ class MarketIndices(Widget):
 
     def update_indices(self) -> None:
         """Update all index displays"""
+        # One query for every index instead of two per index
+        prices = self.db.get_latest_and_prev_batch(self.indices)
         for ticker in self.indices:
-            self.update_index(ticker)
+            self.update_index(ticker, prices[ticker])
+
+    def update_index(
+        self,
+        ticker: str,
+        prices: Optional[Tuple[Optional[DailyPrice], Optional[float]]] = None,
+    ) -> None:
+        """Update single index display
 
-    def update_index(self, ticker: str) -> None:
-        """Update single index display"""
-        latest = self.db.get_latest_price(ticker)
-        prev_close = self.db.get_previous_close(ticker)
+        Args:
+            ticker: Index ticker
+            prices: Optional pre-fetched (latest, previous close) pair
+        """
+        if prices is None:
+            prices = (self.db.get_latest_price(ticker), self.db.get_previous_close(ticker))
+        latest, prev_close = prices
 
+        color_class = None
         if not latest:
             content = f"{ticker}: N/A"
         else:
@@ -49,20 +72,32 @@ class MarketIndices(Widget):
             if prev_close and prev_close != 0:
                 change = price - prev_close
                 change_pct = (change / prev_close) * 100
-                arrow = get_arrow(change)
                 change_str = format_change_pct(change_pct)
 
-                # Determine color class
-                color_class = "gain" if change > 0 else "loss" if change < 0 else "neutral"
+                # Arrow and color class from the sign of the change
+                direction = (change > 0) - (change < 0) + 1
+                arrow = _CHANGE_ARROWS[direction]
+                color_class = _CHANGE_CLASSES[direction]
 
                 content = f"{ticker} {format_price(price)} {arrow} {change_str}"
-                cell = self.query_one(f"#index_{ticker}", Static)
-                cell.remove_class("gain", "loss", "neutral")
-                cell.add_class(color_class)
             else:
                 content = f"{ticker} {format_price(price)}"
 
-        self.query_one(f"#index_{ticker}", Static).update(content)
+        # Skip the widget update (and repaint) if nothing visible changed
+        shown = (content, color_class)
+        last = self._last_content.get(ticker)
+        if last == shown:
+            return
+
+        cell = self._cells.get(ticker)
+        if cell is None:
+            cell = self._cells[ticker] = self.query_one(f"#index_{ticker}", Static)
+        # Only restyle when the class changes, not on every price tick
+        if color_class is not None and (last is None or last[1] != color_class):
+            cell.remove_class("gain", "loss", "neutral")
+            cell.add_class(color_class)
+        cell.update(content)
+        self._last_content[ticker] = shown
 
     def refresh_prices(self) -> None:
         """Refresh prices from database (after API update)"""
@@ -77,14 +112,14 @@ class MarketIndices(Widget):
         """
         self.day_range = day_range
 
-        # Fetch prices to get actual date range
-        prices = self.db.get_daily_prices(ticker, day_range)
+        # Fetch only the first and last trade dates of the range
+        dates = self.db.get_price_date_range(ticker, day_range)
 
-        if prices and len(prices) >= 2:
-            start_date = prices[0].trade_date.strftime('%d/%m/%y')
-            end_date = prices[-1].trade_date.strftime('%d/%m/%y')
+        if dates:
+            start_date = dates[0].strftime('%d/%m/%y')
+            end_date = dates[1].strftime('%d/%m/%y')
             range_text = f"Range: {day_range}d ({start_date} - {end_date})"
         else:
             range_text = f"Range: {day_range}d"
 
-        self.query_one("#range_display", Static).update(range_text)
+        self._range_display.update(range_text)
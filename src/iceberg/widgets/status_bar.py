@@ -4,95 +4,173 @@ from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widget import Widget
 from textual.widgets import Static
+from textual.worker import get_current_worker
 from rich.text import Text
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+import os
+import time
+from typing import Optional, Dict, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from rich.console import Console
     from ..api.finnhub import FinnhubClient
 
+# Fixed segments of the status line
+_HINTS = "j/k:nav  space:mark  c:chart  r:range  s:sort  d:day/range  e:copy  u:update  q:quit"
+_SEPARATOR = " | "
+_VERSION = "Iceberg v1.0"
+
+# Market state -> (label, emoji indicator, plain-text indicator)
+_MARKET_STATES = {
+    "unknown": ("Unknown", "⚪", "[?]"),
+    "pre": ("PRE-MARKET", "🟡", "[~]"),
+    "post": ("AFTER-HOURS", "🟡", "[~]"),
+    "open": ("OPEN", "🟢", "[+]"),
+    "closed": ("CLOSED", "🔴", "[-]"),
+}
+
+
+def _supports_emoji(console: "Console") -> bool:
+    """Whether the terminal should get emoji indicators (not under NO_COLOR, dumb or non-UTF-8)"""
+    if os.environ.get("NO_COLOR"):
+        return False
+    return console.encoding.lower().startswith("utf") and not console.is_dumb_terminal
+
 
 class StatusBar(Widget):
     """Status bar showing hints and last update time"""
 
+    MARKET_STATUS_TTL = 60.0  # Seconds a fetched market status is reused
+
     def __init__(self, finnhub_client: Optional["FinnhubClient"] = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self.finnhub = finnhub_client
         self.market_status = "Unknown"
         self.market_indicator = "⚪"
+        self._use_emoji = True  # Decided once on mount from the console
+        # Left Static, kept from compose instead of queried per update
+        self._status_left = Static("", id="status_left")
+        # Last timestamp shown, formatted once per second at most
+        self._stamp_time: Optional[datetime] = None
+        self._stamp = ""
+        # Inputs of the last left Text built, to skip identical rebuilds
+        self._last_state: Optional[tuple] = None
+        # Last (message, color) requested, redrawn when market status arrives
+        self._last_message: tuple = ("", None)
+        self._render_pending = False  # A coalesced _render_status is queued
+        # time.monotonic() of the last successful market status fetch
+        self._market_status_at: Optional[float] = None
 
     def compose(self) -> ComposeResult:
         """Compose status bar content"""
         with Horizontal(id="status_container"):
-            yield Static("", id="status_left")
-            yield Static("", id="status_right")
+            yield self._status_left
+            # The right side never changes, so it is built once here
+            yield Static(Text.assemble((_VERSION, "white")), id="status_right")
 
     def on_mount(self) -> None:
         """Initialize status bar"""
-        self.fetch_market_status()
-        self.update_status()
+        self._use_emoji = _supports_emoji(self.app.console)
+        self.set_market_state("unknown")
+        self.refresh_market_status()
 
-    def fetch_market_status(self) -> None:
-        """Fetch market status from Finnhub API"""
-        if not self.finnhub:
-            return
-
-        status = self.finnhub.get_market_status('US')
+    def apply_market_status(self, status: Optional[Dict[str, Any]]) -> None:
+        """Set market status and indicator from a Finnhub market-status response"""
         if status:
             is_open = status.get('isOpen', False)
             session = status.get('session', 'unknown')
 
             if is_open:
-                if session == 'pre':
-                    self.market_status = "PRE-MARKET"
-                    self.market_indicator = "🟡"
-                elif session == 'post':
-                    self.market_status = "AFTER-HOURS"
-                    self.market_indicator = "🟡"
-                else:
-                    self.market_status = "OPEN"
-                    self.market_indicator = "🟢"
+                self.set_market_state(session if session in ('pre', 'post') else "open")
             else:
-                self.market_status = "CLOSED"
-                self.market_indicator = "🔴"
+                self.set_market_state("closed")
+
+    def set_market_state(self, state: str) -> None:
+        """Set market status label and indicator (emoji or plain text) for a state"""
+        label, emoji, plain = _MARKET_STATES[state]
+        self.market_status = label
+        self.market_indicator = emoji if self._use_emoji else plain
+
+    def _market_status_worker(self) -> None:
+        """Fetch market status off the UI thread and apply it on the UI thread"""
+        status = self.finnhub.get_market_status('US')
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_market_status, status)
+
+    def _show_market_status(self, status: Optional[Dict[str, Any]]) -> None:
+        """Apply a fetched market status and redraw the current message with it"""
+        if status:
+            self._market_status_at = time.monotonic()
+        self.apply_market_status(status)
+        self.update_status(*self._last_message)
 
     def update_status(self, message: str = "", color: Optional[str] = None) -> None:
         """Update status bar content
 
+        Bursts of calls (e.g. per-ticker progress during an update) are
+        coalesced: only the latest message is built, once, on the next
+        pass of the message loop.
+
         Args:
             message: Status message to display
             color: Optional color for the message ('blue', 'red', 'green', etc.)
         """
-        hints = "j/k:nav  space:mark  c:chart  r:range  s:sort  d:day/range  e:copy  u:update  q:quit"
-        market_info = f"Market: {self.market_status} {self.market_indicator}"
-
-        # Build left side text
-        left_text = Text()
-        left_text.append(market_info, style="white")
-        left_text.append(" | ", style="white")
-
+        self._last_message = (message, color)
+        if not self._render_pending:
+            self._render_pending = True
+            self.call_later(self._render_status)
+
+    def _render_status(self) -> None:
+        """Build and show the status line for the latest requested message"""
+        self._render_pending = False
+        message, color = self._last_message
         if message:
-            if color:
-                left_text.append(message, style=color)
-            else:
-                left_text.append(message, style="white")
+            status = (message, color or "white")
         else:
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            left_text.append(f"Last update: {now}", style="white")
+            status = (f"Last update: {self.timestamp()}", "white")
 
-        left_text.append(" | ", style="white")
-        left_text.append(hints, style="white")
+        # Nothing visible changed (same market state, message and second)
+        state = (self.market_status, self.market_indicator, status)
+        if state == self._last_state:
+            return
+        self._last_state = state
 
-        # Build right side text
-        right_text = Text()
-        right_text.append("Iceberg v1.0", style="white")
+        market_info = f"Market: {self.market_status} {self.market_indicator}"
 
-        status_left = self.query_one("#status_left", Static)
-        status_right = self.query_one("#status_right", Static)
-        status_left.update(left_text)
-        status_right.update(right_text)
+        # Build left side text
+        left_text = Text.assemble(
+            (market_info, "white"),
+            (_SEPARATOR, "white"),
+            status,
+            (_SEPARATOR, "white"),
+            (_HINTS, "white"),
+        )
+        self._status_left.update(left_text)
+
+    def timestamp(self) -> str:
+        """Current time as YYYY-MM-DD HH:MM:SS, reformatted only when the second changes"""
+        now = datetime.now().replace(microsecond=0)
+        if now != self._stamp_time:
+            self._stamp_time = now
+            self._stamp = now.strftime("%Y-%m-%d %H:%M:%S")
+        return self._stamp
 
     def refresh_market_status(self) -> None:
-        """Refresh market status and update display"""
-        self.fetch_market_status()
+        """Refresh market status and update display
+
+        The HTTP call runs in a thread worker so mount and refreshes never
+        wait on it; the display updates again once the status arrives.
+        Sessions change on a minute scale, so a status younger than
+        MARKET_STATUS_TTL is reused without a request.
+        """
         self.update_status()
+        fetched_at = self._market_status_at
+        if fetched_at is not None and time.monotonic() - fetched_at < self.MARKET_STATUS_TTL:
+            return
+        if self.finnhub:
+            self.run_worker(
+                self._market_status_worker,
+                thread=True,
+                exclusive=True,
+                group="market_status",
+            )
@@ -4,7 +4,10 @@ from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.widget import Widget
 from textual.widgets import Static
-from typing import Optional
+from textual.timer import Timer
+from typing import Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from bisect import bisect_right
 from rich.text import Text
 
 from ..data.db import Database
@@ -15,61 +18,136 @@ from ..analysis.indicators import (
     compute_ema,
     compute_trend,
     compute_volatility,
-    compute_distance_from_high,
-    count_recovery_patterns,
-    compute_long_term_trend,
     compute_beta,
+    compute_benchmark_stats,
+    align_by_date,
     find_support_resistance,
 )
-from ..analysis.models import MACDBias, RSIBias, TrendBias, VolatilityBias
-from ..analysis.scoring import (
-    calculate_trade_score,
-    calculate_investment_score,
-    get_rating_label,
-    get_rating_color,
-    generate_score_bar,
+from ..analysis.models import (
+    BenchmarkStats,
+    MACDBias,
+    RSIBias,
+    TrendBias,
+    TrendSummary,
+    VolatilityBias,
 )
 
+# Display colors (and trend labels) per indicator bias
+_RSI_COLORS = {
+    RSIBias.OVERBOUGHT: "#ff0000",
+    RSIBias.STRONG: "#00ff00",
+    RSIBias.NEUTRAL: "white",
+    RSIBias.WEAK: "#ffaa00",
+    RSIBias.OVERSOLD: "#0088ff",
+}
+_MACD_COLORS = {
+    MACDBias.BULL: "#00ff00",
+    MACDBias.BEAR: "#ff0000",
+    MACDBias.NEUTRAL: "white",
+}
+_VOLATILITY_COLORS = {
+    VolatilityBias.CALM: "#00ff00",
+    VolatilityBias.CHOPPY: "#ffaa00",
+    VolatilityBias.WILD: "#ff0000",
+}
+_TREND_DISPLAY = {
+    TrendBias.UP: ("Up", "#00ff00"),
+    TrendBias.DOWN: ("Down", "#ff0000"),
+    TrendBias.SIDEWAYS: ("Sideways", "white"),
+}
+
+# Volume magnitudes (ascending) and the suffix for each count of them reached
+_VOLUME_THRESHOLDS = (1_000, 1_000_000, 1_000_000_000)
+_VOLUME_SUFFIXES = ("", "K", "M", "B")
+
+# (arrow, color) for a price move, indexed by its sign + 1 (down, flat, up)
+_MOVE_DISPLAY = (("▼", "#ff0000"), ("→", "white"), ("▲", "#00ff00"))
+
+
+def _sma_parts(
+    label: str, sma: Optional[float], current_price: float, trend: Optional[TrendSummary]
+) -> tuple:
+    """Display parts for an SMA: value, price distance from it and its trend"""
+    if not sma:
+        return (f"{label}N/A",)
+
+    diff_pct = ((current_price - sma) / sma) * 100
+    arrow = _MOVE_DISPLAY[(current_price > sma) - (current_price < sma) + 1][0]
+    color = "#00ff00" if current_price > sma else "#ff0000"
+    direction, trend_color = _TREND_DISPLAY[trend.bias] if trend else ("N/A", "white")
+
+    return (
+        label,
+        (f"${sma:.2f} ({arrow} {diff_pct:+.2f}%)", color),
+        (" Trend: ", "white"),
+        (direction, trend_color),
+    )
+
 
 class TechnicalPanel(Widget):
     """Technical analysis indicators display"""
 
+    RENDER_DELAY = 0.04  # Seconds to coalesce key-repeat bursts of range changes
+    ANALYSIS_CACHE_SIZE = 16
+    SECTIONS_CACHE_SIZE = 32
+
     def __init__(self, db: Database, initial_day_range: int = 120, **kwargs) -> None:
         super().__init__(**kwargs)
         self.db = db
         self.current_ticker: Optional[str] = None
         self.current_range: int = initial_day_range  # Set from app
         self.last_analysis_text: Optional[str] = None
+        self._render_timer: Optional[Timer] = None  # Pending debounced render
+        # LRU of built displays keyed by (ticker, range, db version), so
+        # re-renders of an unchanged ticker/range skip the fetch and indicators
+        self._analysis_cache: "OrderedDict[Tuple[str, int, int], Union[Text, str]]" = OrderedDict()
+        # Benchmark -> ((db version, first date, last date), return stats),
+        # shared by every ticker's beta
+        self._benchmark_stats: Dict[str, Tuple[tuple, Optional[BenchmarkStats]]] = {}
+        # LRU of range-independent sections keyed by (ticker, db version), so
+        # a new range for a recently viewed ticker only builds the SMA(range) part
+        self._sections: "OrderedDict[Tuple[str, int], Union[tuple, str]]" = OrderedDict()
+        # Display Static, kept from compose instead of queried per render
+        self._display = Static("Select a ticker to view analysis", id="technical_display")
 
     @staticmethod
     def format_volume(volume: float) -> str:
         """Format volume with K/M/B suffixes"""
-        if volume >= 1_000_000_000:
-            return f"{volume / 1_000_000_000:.1f}B"
-        elif volume >= 1_000_000:
-            return f"{volume / 1_000_000:.1f}M"
-        elif volume >= 1_000:
-            return f"{volume / 1_000:.1f}K"
-        else:
-            return f"{volume:.0f}"
+        # Number of magnitude thresholds reached picks the divisor and suffix
+        idx = bisect_right(_VOLUME_THRESHOLDS, volume)
+        if idx:
+            return f"{volume / _VOLUME_THRESHOLDS[idx - 1]:.1f}{_VOLUME_SUFFIXES[idx]}"
+        return f"{volume:.0f}"
 
     def compose(self) -> ComposeResult:
         """Compose technical panel"""
         with VerticalScroll(id="technical_container"):
-            yield Static("Select a ticker to view analysis", id="technical_display")
+            yield self._display
 
     def update_ticker(self, ticker: str, day_range: Optional[int] = None) -> None:
         """Update analysis for new ticker"""
         self.current_ticker = ticker
         if day_range is not None:
             self.current_range = day_range
+        self.cancel_scheduled_render()
         self.render_analysis()
 
     def update_range(self, day_range: int) -> None:
         """Update day range"""
         self.current_range = day_range
         if self.current_ticker:
-            self.render_analysis()
+            self.schedule_render()
+
+    def schedule_render(self) -> None:
+        """Schedule a render, coalescing bursts of range changes (e.g. key repeat)"""
+        self.cancel_scheduled_render()
+        self._render_timer = self.set_timer(self.RENDER_DELAY, self.render_analysis)
+
+    def cancel_scheduled_render(self) -> None:
+        """Drop a pending debounced render (superseded by an immediate one)"""
+        if self._render_timer is not None:
+            self._render_timer.stop()
+            self._render_timer = None
 
     def get_analysis_text(self) -> Optional[str]:
         """Get the current analysis text for export"""
@@ -80,75 +158,116 @@ class TechnicalPanel(Widget):
         if not self.current_ticker:
             return
 
+        key = (self.current_ticker, self.current_range, self.db.version)
+        display = self._analysis_cache.get(key)
+        if display is not None:
+            self._analysis_cache.move_to_end(key)
+        else:
+            display = self.build_analysis(self.current_ticker, self.current_range)
+            self._analysis_cache[key] = display
+            if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+
+        if isinstance(display, Text):
+            # Store plain text for clipboard export
+            self.last_analysis_text = display.plain
+
+        # Update display with Text object
+        self._display.update(display)
+
+    def compute_benchmark_beta(
+        self, benchmark: str, dates: List[str], closes: List[float], days: int
+    ) -> Optional[float]:
+        """Beta of a stock's (dates, closes) against a benchmark over the last N days
+
+        The stock's series is the one already fetched; the benchmark read is
+        served from the database read cache, and its return statistics are
+        kept per data version and date window, since they are the same for
+        every ticker whose dates cover the whole benchmark series.
+        """
+        bench_dates, bench_closes = self.db.get_daily_closes(benchmark, days)
+        if not bench_dates:
+            return None
+
+        # Align on common dates with a linear merge over sorted dates
+        stock_aligned, bench_aligned = align_by_date(dates, closes, bench_dates, bench_closes)
+
+        stats = None
+        if len(bench_aligned) == len(bench_closes):
+            # Every benchmark day matched, so its statistics can be shared
+            key = (self.db.version, bench_dates[0], bench_dates[-1])
+            cached = self._benchmark_stats.get(benchmark)
+            if cached is not None and cached[0] == key:
+                stats = cached[1]
+            else:
+                stats = compute_benchmark_stats(bench_closes)
+                self._benchmark_stats[benchmark] = (key, stats)
+
+        return compute_beta(stock_aligned, bench_aligned, market_stats=stats)
+
+    def build_analysis(self, ticker: str, day_range: int) -> Union[Text, str]:
+        """Build the technical analysis display for a ticker and day range
+
+        Only the SMA(range) part depends on the range; the rest comes from
+        build_sections, kept per ticker and data version.
+        """
+        key = (ticker, self.db.version)
+        sections = self._sections.get(key)
+        if sections is not None:
+            self._sections.move_to_end(key)
+        else:
+            sections = self.build_sections(ticker)
+            self._sections[key] = sections
+            if len(self._sections) > self.SECTIONS_CACHE_SIZE:
+                self._sections.popitem(last=False)
+        if isinstance(sections, str):
+            return sections
+
+        before, after, closes = sections
+        range_period = min(len(closes), day_range)
+        sma_range = compute_sma(closes, range_period)
+        trend_range = compute_trend(closes, range_period, sma_range)
+
+        return Text.assemble(
+            *before,
+            *_sma_parts(f"SMA({day_range}): ", sma_range, closes[-1], trend_range),
+            *after,
+        )
+
+    def build_sections(self, ticker: str) -> Union[Tuple[list, list, List[float]], str]:
+        """Build the range-independent analysis for a ticker
+
+        Returns:
+            (parts before SMA(range), parts after it, closes), or a message
+            if there is not enough data
+        """
         # Fetch price data - always use 365 days for consistent indicator calculation
         # MACD, RSI, SMAs should be calculated the same way regardless of selected range
         data_days = 365
-        daily_prices = self.db.get_daily_prices(self.current_ticker, data_days)
+        # Column-wise fetch: dates, closes and volumes without per-day objects
+        dates, closes, volumes = self.db.get_daily_columns(ticker, data_days)
 
-        if not daily_prices or len(daily_prices) < 20:
-            self.query_one("#technical_display", Static).update(
-                f"Insufficient data for {self.current_ticker} technical analysis"
-            )
-            return
+        if len(closes) < 20:
+            return f"Insufficient data for {ticker} technical analysis"
 
-        # Extract closes and volumes
-        closes = [p.close for p in daily_prices]
-        volumes = [p.volume for p in daily_prices]
-
-        # Compute indicators
+        # Compute indicators, sharing intermediates between them
         current_price = closes[-1]
-        macd = compute_macd(closes)
-        rsi = compute_rsi(closes, 14)
 
-        # SMAs for scoring and display
-        sma10 = compute_sma(closes, 10)
-        sma20 = compute_sma(closes, 20)
-        sma50 = compute_sma(closes, 50)
-        sma100 = compute_sma(closes, 100)
-
-        # EMA for display
+        # EMA(12) for display, also the fast line of MACD
         ema12_list = compute_ema(closes, 12)
         ema12 = ema12_list[-1] if ema12_list else None
+        macd = compute_macd(closes, ema12_list)
+        rsi = compute_rsi(closes, 14)
 
-        # Trends for scoring and display
-        trend10 = compute_trend(closes, 10)
-        trend20 = compute_trend(closes, 20)
-        trend50 = compute_trend(closes, 50)
-        trend_range = compute_trend(closes, min(len(closes), self.current_range))
-        long_term_trend = compute_long_term_trend(closes, 100)
+        # SMA(20) and its trend for display
+        sma20 = compute_sma(closes, 20)
+        trend20 = compute_trend(closes, 20, sma20)
 
         volatility = compute_volatility(closes)
 
-        # Beta (12mo) - calculate vs both SPY (market) and QQQ (tech)
-        stock_daily = self.db.get_daily_prices(self.current_ticker, data_days)
-        spy_daily = self.db.get_daily_prices("SPY", data_days)
-        qqq_daily = self.db.get_daily_prices("QQQ", data_days)
-
-        # Beta vs SPY (broad market)
-        if stock_daily and spy_daily:
-            stock_map = {dp.trade_date: dp.close for dp in stock_daily}
-            spy_map = {dp.trade_date: dp.close for dp in spy_daily}
-            common_dates_spy = sorted(set(stock_map.keys()) & set(spy_map.keys()))
-            aligned_stock_closes_spy = [stock_map[d] for d in common_dates_spy]
-            aligned_spy_closes = [spy_map[d] for d in common_dates_spy]
-            beta_spy = compute_beta(aligned_stock_closes_spy, aligned_spy_closes)
-        else:
-            beta_spy = None
-
-        # Beta vs QQQ (tech sector)
-        if stock_daily and qqq_daily:
-            stock_map = {dp.trade_date: dp.close for dp in stock_daily}
-            qqq_map = {dp.trade_date: dp.close for dp in qqq_daily}
-            common_dates_qqq = sorted(set(stock_map.keys()) & set(qqq_map.keys()))
-            aligned_stock_closes_qqq = [stock_map[d] for d in common_dates_qqq]
-            aligned_qqq_closes = [qqq_map[d] for d in common_dates_qqq]
-            beta_qqq = compute_beta(aligned_stock_closes_qqq, aligned_qqq_closes)
-        else:
-            beta_qqq = None
-
-        # v1.1 indicators
-        distance_from_high = compute_distance_from_high(closes, 20)
-        resilience_count = count_recovery_patterns(closes, 180)
+        # Beta (12mo) - calculate vs both SPY (broad market) and QQQ (tech sector)
+        beta_spy = self.compute_benchmark_beta("SPY", dates, closes, data_days)
+        beta_qqq = self.compute_benchmark_beta("QQQ", dates, closes, data_days)
 
         # Volume statistics (1 year or available)
         # Filter out zero volumes (incomplete/live trading days)
@@ -170,141 +289,88 @@ class TechnicalPanel(Widget):
         # Support/Resistance levels
         support, resistance = find_support_resistance(closes, window=5)
 
-        # Calculate Iceberg Scores (v1.3 - returns ScoreResult)
-        trade_result = calculate_trade_score(
-            current_price=current_price,
-            macd_bias=macd.bias if macd else None,
-            macd_hist=macd.hist if macd else None,
-            rsi_value=rsi.value if rsi else None,
-            rsi_bias=rsi.bias if rsi else None,
-            sma10=sma10,
-            sma20=sma20,
-            sma50=sma50,
-            sma100=sma100,
-            trend10_bias=trend10.bias if trend10 else None,
-            trend50_bias=trend50.bias if trend50 else None,
-            long_term_trend=long_term_trend,
-            volatility_bias=volatility.bias if volatility else None,
-            distance_from_high=distance_from_high,
-            resilience_count=resilience_count,
-            closes=closes,
-            support=support,
-            resistance=resistance
-        )
-
-        inv_result = calculate_investment_score(
-            current_price=current_price,
-            macd_bias=macd.bias if macd else None,
-            macd_hist=macd.hist if macd else None,
-            rsi_value=rsi.value if rsi else None,
-            rsi_bias=rsi.bias if rsi else None,
-            sma10=sma10,
-            sma20=sma20,
-            sma50=sma50,
-            sma100=sma100,
-            trend10_bias=trend10.bias if trend10 else None,
-            trend50_bias=trend50.bias if trend50 else None,
-            long_term_trend=long_term_trend,
-            volatility_bias=volatility.bias if volatility else None,
-            distance_from_high=distance_from_high,
-            resilience_count=resilience_count,
-            closes=closes
-        )
-
-        # Build display using Text object for consistent rendering
-        display = Text()
+        # Build display as (text, style) parts, assembled into one Text at the end
+        parts = []
 
         # Title
-        display.append(f"{self.current_ticker} - Technical Analysis", style="bold bright_white")
-        display.append("\n\n")
+        parts.extend((
+            (f"{ticker} - Technical Analysis", "bold bright_white"),
+            "\n\n",
+        ))
 
         # Current price and change (moved to top)
         if len(closes) >= 2:
-            current = closes[-1]
             yesterday = closes[-2]
-            change = current - yesterday
+            change = current_price - yesterday
             change_pct = (change / yesterday * 100) if yesterday != 0 else 0
+            arrow, change_color = _MOVE_DISPLAY[(change > 0) - (change < 0) + 1]
 
-            if change > 0:
-                change_color = "#00ff00"
-                arrow = "▲"
-            elif change < 0:
-                change_color = "#ff0000"
-                arrow = "▼"
-            else:
-                change_color = "white"
-                arrow = "→"
-
-            display.append("Price:           ")
-            display.append(f"${current:.2f}  ", style="white")
-            display.append(f"{arrow} ${abs(change):.2f} ({change_pct:+.2f}%)", style=change_color)
-            display.append("\n")
+            parts.extend((
+                "Price:           ",
+                (f"${current_price:.2f}  ", "white"),
+                (f"{arrow} ${abs(change):.2f} ({change_pct:+.2f}%)", change_color),
+                "\n",
+            ))
 
         # 52-week high/low (moved to top)
         if len(closes) >= 240:
-            range_days = min(252, len(closes))
-            week52_high = max(closes[-range_days:])
-            week52_low = min(closes[-range_days:])
-            current = closes[-1]
+            # One slice of the last year, reduced by the C max/min builtins
+            week52 = closes[-min(252, len(closes)):]
+            week52_high = max(week52)
+            week52_low = min(week52)
 
-            dist_from_high = ((current - week52_high) / week52_high * 100) if week52_high != 0 else 0
-            dist_from_low = ((current - week52_low) / week52_low * 100) if week52_low != 0 else 0
+            dist_from_high = ((current_price - week52_high) / week52_high * 100) if week52_high != 0 else 0
+            dist_from_low = ((current_price - week52_low) / week52_low * 100) if week52_low != 0 else 0
 
             high_color = "#ff0000" if dist_from_high < -10 else "#ffaa00" if dist_from_high < 0 else "#00ff00"
             low_color = "#00ff00" if dist_from_low > 10 else "#ffaa00"
 
-            display.append("52-Week Range:   ")
-            display.append(f"High: ${week52_high:.2f} ({dist_from_high:+.1f}%)  ", style=high_color)
-            display.append(f"Low: ${week52_low:.2f} ({dist_from_low:+.1f}%)", style=low_color)
-            display.append("\n")
+            parts.extend((
+                "52-Week Range:   ",
+                (f"High: ${week52_high:.2f} ({dist_from_high:+.1f}%)  ", high_color),
+                (f"Low: ${week52_low:.2f} ({dist_from_low:+.1f}%)", low_color),
+                "\n",
+            ))
 
         # Volume statistics (1 year or available)
-        display.append("Volume:          ")
-        display.append(
-            f"Avg {self.format_volume(avg_volume)} | Last Close {self.format_volume(latest_volume)} ",
-            style="white"
-        )
-        display.append(f"{vol_arrow} ", style=vol_color)
-        display.append(f"({vol_diff_pct:+.0f}%)", style=vol_color)
-        display.append(
-            f" | Range: {self.format_volume(min_volume)} - {self.format_volume(max_volume)}",
-            style="white"
-        )
-        display.append("\n")
+        parts.extend((
+            "Volume:          ",
+            (f"Avg {self.format_volume(avg_volume)} | Last Close {self.format_volume(latest_volume)} ", "white"),
+            (f"{vol_arrow} ", vol_color),
+            (f"({vol_diff_pct:+.0f}%)", vol_color),
+            (f" | Range: {self.format_volume(min_volume)} - {self.format_volume(max_volume)}", "white"),
+            "\n",
+        ))
 
-        display.append("\n")  # Blank line separator
+        parts.append("\n")  # Blank line separator
 
         # RSI
         if rsi:
-            color_map = {
-                RSIBias.OVERBOUGHT: "#ff0000",
-                RSIBias.STRONG: "#00ff00",
-                RSIBias.NEUTRAL: "white",
-                RSIBias.WEAK: "#ffaa00",
-                RSIBias.OVERSOLD: "#0088ff",
-            }
-            color = color_map.get(rsi.bias, "white")
-            display.append("RSI(14):         ")
-            display.append(f"{rsi.value:.1f}", style=color)
-            display.append(f" - {rsi.bias.value.title()}\n", style=color)
+            color = _RSI_COLORS.get(rsi.bias, "white")
+            parts.extend((
+                "RSI(14):         ",
+                (f"{rsi.value:.1f}", color),
+                (f" - {rsi.bias.value.title()}\n", color),
+            ))
         else:
-            display.append("RSI(14):         N/A\n")
+            parts.append("RSI(14):         N/A\n")
 
         # MACD
         if macd:
-            color = "#00ff00" if macd.bias == MACDBias.BULL else "#ff0000" if macd.bias == MACDBias.BEAR else "white"
-            display.append("MACD(12,26,9):   ")
-            display.append(macd.bias.value.title(), style=color)
-            display.append(f" (MACD {macd.macd:.2f}, Signal {macd.signal:.2f}, Hist {macd.hist:.2f})\n", style="white")
+            color = _MACD_COLORS.get(macd.bias, "white")
+            parts.extend((
+                "MACD(12,26,9):   ",
+                (macd.bias.value.title(), color),
+                (f" (MACD {macd.macd:.2f}, Signal {macd.signal:.2f}, Hist {macd.hist:.2f})\n", "white"),
+            ))
         else:
-            display.append("MACD(12,26,9):   N/A\n")
+            parts.append("MACD(12,26,9):   N/A\n")
 
         # EMA(12)
-        current_price = closes[-1] if closes else 0
         if ema12:
             ema12_diff_pct = ((current_price - ema12) / ema12) * 100 if ema12 != 0 else 0
             ema12_color = "#00ff00" if current_price > ema12 else "#ff0000"
-            arrow12 = "▲" if current_price > ema12 else "▼" if current_price < ema12 else "→"
+            arrow12 = _MOVE_DISPLAY[(current_price > ema12) - (current_price < ema12) + 1][0]
 
             # Determine EMA trend (same thresholds as SMA trends)
             if ema12_diff_pct > 2.0:
@@ -317,65 +383,23 @@ class TechnicalPanel(Widget):
                 ema12_trend_direction = "Sideways"
                 ema12_trend_color = "white"
 
-            display.append("EMA(12):         ")
-            display.append(f"${ema12:.2f} ({arrow12} {ema12_diff_pct:+.2f}%)", style=ema12_color)
-            display.append(" Trend: ", style="white")
-            display.append(ema12_trend_direction, style=ema12_trend_color)
-            display.append("\n")
+            parts.extend((
+                "EMA(12):         ",
+                (f"${ema12:.2f} ({arrow12} {ema12_diff_pct:+.2f}%)", ema12_color),
+                (" Trend: ", "white"),
+                (ema12_trend_direction, ema12_trend_color),
+                "\n",
+            ))
         else:
-            display.append("EMA(12):         N/A\n")
+            parts.append("EMA(12):         N/A\n")
 
         # SMAs - side by side to save space
+        parts.extend(_sma_parts("SMA(20):         ", sma20, current_price, trend20))
+        parts.append(("  │  ", "white"))
 
-        # SMA(20) data
-        if sma20:
-            sma20_diff_pct = ((current_price - sma20) / sma20) * 100 if sma20 != 0 else 0
-            sma20_emoji = "🟢" if current_price > sma20 else "🔴"
-            sma20_color = "#00ff00" if current_price > sma20 else "#ff0000"
-
-            if trend20:
-                trend20_direction = "Up" if trend20.bias == TrendBias.UP else "Down" if trend20.bias == TrendBias.DOWN else "Sideways"
-                trend20_color = "#00ff00" if trend20.bias == TrendBias.UP else "#ff0000" if trend20.bias == TrendBias.DOWN else "white"
-            else:
-                trend20_direction = "N/A"
-                trend20_color = "white"
-
-        # SMA(range) data
-        sma_range = compute_sma(closes, min(len(closes), self.current_range)) if closes and len(closes) >= 2 else None
-        if sma_range:
-            sma_range_diff_pct = ((current_price - sma_range) / sma_range) * 100 if sma_range != 0 else 0
-            sma_range_emoji = "🟢" if current_price > sma_range else "🔴"
-            sma_range_color = "#00ff00" if current_price > sma_range else "#ff0000"
-
-            if trend_range:
-                trend_range_direction = "Up" if trend_range.bias == TrendBias.UP else "Down" if trend_range.bias == TrendBias.DOWN else "Sideways"
-                trend_range_color = "#00ff00" if trend_range.bias == TrendBias.UP else "#ff0000" if trend_range.bias == TrendBias.DOWN else "white"
-            else:
-                trend_range_direction = "N/A"
-                trend_range_color = "white"
-
-        # Display SMAs side by side
-        if sma20:
-            arrow20 = "▲" if current_price > sma20 else "▼" if current_price < sma20 else "→"
-            display.append("SMA(20):         ")
-            display.append(f"${sma20:.2f} ({arrow20} {sma20_diff_pct:+.2f}%)", style=sma20_color)
-            display.append(" Trend: ", style="white")
-            display.append(trend20_direction, style=trend20_color)
-        else:
-            display.append("SMA(20):         N/A")
-
-        display.append("  │  ", style="white")
-
-        if sma_range:
-            arrow_range = "▲" if current_price > sma_range else "▼" if current_price < sma_range else "→"
-            display.append(f"SMA({self.current_range}): ")
-            display.append(f"${sma_range:.2f} ({arrow_range} {sma_range_diff_pct:+.2f}%)", style=sma_range_color)
-            display.append(" Trend: ", style="white")
-            display.append(trend_range_direction, style=trend_range_color)
-        else:
-            display.append(f"SMA({self.current_range}): N/A")
-
-        display.append("\n")
+        # SMA(range) goes here, added per range by build_analysis
+        before = parts
+        parts = ["\n"]
 
         # Helper function for beta interpretation
         def format_beta(beta_value, benchmark):
@@ -402,54 +426,53 @@ class TechnicalPanel(Widget):
 
         # Volatility metrics (aligned)
         if volatility:
-            color_map = {
-                VolatilityBias.CALM: "#00ff00",
-                VolatilityBias.CHOPPY: "#ffaa00",
-                VolatilityBias.WILD: "#ff0000",
-            }
-            color = color_map.get(volatility.bias, "white")
-            display.append("Volatility:      ")
-            display.append(volatility.bias.value.title(), style=color)
-            display.append(f" (daily σ = {volatility.sigma:.2f}%)\n", style="white")
+            color = _VOLATILITY_COLORS.get(volatility.bias, "white")
+            parts.extend((
+                "Volatility:      ",
+                (volatility.bias.value.title(), color),
+                (f" (daily σ = {volatility.sigma:.2f}%)\n", "white"),
+            ))
         else:
-            display.append("Volatility:      N/A\n")
+            parts.append("Volatility:      N/A\n")
 
         # Beta (both QQQ and SPY on same line)
         beta_qqq_text, beta_qqq_color = format_beta(beta_qqq, "QQQ")
         beta_spy_text, beta_spy_color = format_beta(beta_spy, "SPY")
 
-        display.append("Beta (12mo):     ")
-        display.append("QQQ: ", style="white")
-        display.append(beta_qqq_text, style=beta_qqq_color)
-        display.append("  │  ", style="white")
-        display.append("SPY: ", style="white")
-        display.append(beta_spy_text, style=beta_spy_color)
-        display.append("\n")
+        parts.extend((
+            "Beta (12mo):     ",
+            ("QQQ: ", "white"),
+            (beta_qqq_text, beta_qqq_color),
+            ("  │  ", "white"),
+            ("SPY: ", "white"),
+            (beta_spy_text, beta_spy_color),
+            "\n",
+        ))
 
         # Support/Resistance levels
-        display.append("S/R Levels:      ")
+        parts.append("S/R Levels:      ")
         if support:
             support_pct = ((support - current_price) / current_price) * 100
             support_color = "#ffaa00" if abs(support_pct) < 5 else "white"  # Orange if close
-            display.append(f"Support: ${support:.2f} ", style="white")
-            display.append(f"({support_pct:+.1f}%)", style=support_color)
+            parts.extend((
+                (f"Support: ${support:.2f} ", "white"),
+                (f"({support_pct:+.1f}%)", support_color),
+            ))
         else:
-            display.append("Support: N/A", style="white")
+            parts.append(("Support: N/A", "white"))
 
-        display.append("  │  ", style="white")
+        parts.append(("  │  ", "white"))
 
         if resistance:
             resistance_pct = ((resistance - current_price) / current_price) * 100
             resistance_color = "#ffaa00" if resistance_pct < 5 else "white"  # Orange if close
-            display.append(f"Resistance: ${resistance:.2f} ", style="white")
-            display.append(f"({resistance_pct:+.1f}%)", style=resistance_color)
+            parts.extend((
+                (f"Resistance: ${resistance:.2f} ", "white"),
+                (f"({resistance_pct:+.1f}%)", resistance_color),
+            ))
         else:
-            display.append("Resistance: N/A", style="white")
+            parts.append(("Resistance: N/A", "white"))
 
-        display.append("\n")
+        parts.append("\n")
 
-        # Store plain text for clipboard export
-        self.last_analysis_text = display.plain
-
-        # Update display with Text object
-        self.query_one("#technical_display", Static).update(display)
+        return before, parts, closes
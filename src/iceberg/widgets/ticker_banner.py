@@ -4,12 +4,25 @@ from textual.widget import Widget
 from textual.widgets import Static
 from textual.app import ComposeResult
 from typing import Optional
+from functools import lru_cache
 import pyfiglet
 
 from ..data.db import Database
 from ..utils.formatting import format_market_cap
 
 
+@lru_cache(maxsize=1)
+def _doom_figlet() -> pyfiglet.Figlet:
+    """Figlet renderer for the doom font, loaded and parsed once"""
+    return pyfiglet.Figlet(font="doom")
+
+
+@lru_cache(maxsize=256)
+def render_ticker_ascii(ticker: str) -> str:
+    """Doom-font ASCII art for a ticker, with trailing whitespace stripped"""
+    return _doom_figlet().renderText(ticker).rstrip()
+
+
 class TickerBanner(Widget):
     """Large ASCII art display of current ticker symbol"""
 
@@ -17,13 +30,18 @@ class TickerBanner(Widget):
         super().__init__(**kwargs)
         self.db = db
         self.current_ticker = "AAPL"
+        # Child Statics, kept from compose instead of queried per update
+        self._ascii = Static("", id="ticker_ascii")
+        self._company_name = Static("", id="company_name")
+        self._industry = Static("", id="industry")
+        self._market_cap = Static("", id="market_cap")
 
     def compose(self) -> ComposeResult:
         """Compose the banner display"""
-        yield Static("", id="ticker_ascii")
-        yield Static("", id="company_name")
-        yield Static("", id="industry")
-        yield Static("", id="market_cap")
+        yield self._ascii
+        yield self._company_name
+        yield self._industry
+        yield self._market_cap
 
     def on_mount(self) -> None:
         """Render initial ticker on mount"""
@@ -51,22 +69,19 @@ class TickerBanner(Widget):
         """
         self.current_ticker = ticker.upper()
 
-        # Generate ASCII art using doom font
+        # Generate ASCII art using doom font (cached per ticker)
         try:
-            ascii_art = pyfiglet.figlet_format(self.current_ticker, font="doom")
-            # Strip trailing whitespace to reduce vertical space
-            ascii_art = ascii_art.rstrip()
-            self.query_one("#ticker_ascii", Static).update(ascii_art)
+            self._ascii.update(render_ticker_ascii(self.current_ticker))
         except Exception as e:
             # Fallback to plain text if something goes wrong
-            self.query_one("#ticker_ascii", Static).update(f"\n  {self.current_ticker}\n")
+            self._ascii.update(f"\n  {self.current_ticker}\n")
 
         # Update company name (strip leading/trailing whitespace)
-        self.query_one("#company_name", Static).update(company_name.strip() if company_name else "")
+        self._company_name.update(company_name.strip() if company_name else "")
 
         # Update industry
         industry_text = industry if industry else "N/A"
-        self.query_one("#industry", Static).update(industry_text)
+        self._industry.update(industry_text)
 
         # Calculate and update live market cap
         if shares_outstanding and current_price:
@@ -76,4 +91,4 @@ class TickerBanner(Widget):
         else:
             market_cap_text = "Market cap: N/A"
 
-        self.query_one("#market_cap", Static).update(market_cap_text)
+        self._market_cap.update(market_cap_text)
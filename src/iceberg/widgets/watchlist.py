@@ -8,7 +8,7 @@ from textual.widgets.option_list import Option
 from typing import Optional
 from rich.text import Text
 
-from ..data.db import Database
+from ..data.db import Database, utc_today
 from ..data.loader import load_watchlist_from_csv
 from ..data.models import WatchlistItem
 from ..utils.formatting import (
@@ -45,11 +45,18 @@ class Watchlist(Widget):
         self._preserved_ticker: Optional[str] = None  # Preserve selection across updates
         self.comparison_ticker: Optional[str] = None  # Ticker marked for comparison
         self.selected_ticker: Optional[str] = None  # Currently selected/viewed ticker
+        # Inputs of the last range-change / score pass over self.items, to
+        # skip identical reruns (reset whenever the items are rebuilt)
+        self._range_changes_key: Optional[tuple] = None
+        self._scores_key: Optional[tuple] = None
+        # Child widgets, kept from compose instead of queried per update
+        self._header = Static("", id="watchlist_header")
+        self._option_list = OptionList(id="ticker_list")
 
     def compose(self) -> ComposeResult:
         """Compose watchlist"""
-        yield Static("", id="watchlist_header")
-        yield OptionList(id="ticker_list")
+        yield self._header
+        yield self._option_list
 
     def on_mount(self) -> None:
         """Load watchlist on mount"""
@@ -60,21 +67,12 @@ class Watchlist(Widget):
         # Load tickers from CSV
         ticker_pairs = load_watchlist_from_csv(self.csv_path)
 
-        # Create watchlist items and fetch prices
-        self.items = []
-        for ticker, name in ticker_pairs:
-            item = WatchlistItem(ticker=ticker, name=name)
+        # Create watchlist items
+        self.items = [WatchlistItem(ticker=ticker, name=name) for ticker, name in ticker_pairs]
+        self._range_changes_key = self._scores_key = None
 
-            # Fetch latest and previous prices for daily change
-            latest = self.db.get_latest_price(ticker)
-            if latest:
-                item.current_price = latest.close
-
-            prev_close = self.db.get_previous_close(ticker)
-            if prev_close:
-                item.previous_close = prev_close
-
-            self.items.append(item)
+        # Fetch latest and previous prices for daily change
+        self.apply_latest_prices()
 
         # Calculate range-based changes
         self.calculate_range_changes()
@@ -86,6 +84,16 @@ class Watchlist(Widget):
         self.sort_items()
         self.update_display()
 
+    def apply_latest_prices(self) -> None:
+        """Set current price and previous close on every item from one batched query"""
+        prices = self.db.get_latest_and_prev_batch([item.ticker for item in self.items])
+        for item in self.items:
+            latest, prev_close = prices[item.ticker]
+            if latest:
+                item.current_price = latest.close
+            if prev_close:
+                item.previous_close = prev_close
+
     def update_header(self) -> None:
         """Update the header label based on change mode and sort mode"""
         if self.change_mode == "day":
@@ -106,12 +114,12 @@ class Watchlist(Widget):
         header.append("Watchlist", style="bold")
         header.append(f" | {change_text}\nSort: {sort_label}")
 
-        self.query_one("#watchlist_header", Static).update(header)
+        self._header.update(header)
 
     def update_display(self) -> None:
         """Update the display with current data"""
         self.update_header()
-        option_list = self.query_one("#ticker_list", OptionList)
+        option_list = self._option_list
         option_list.clear_options()
 
         for item in self.items:
@@ -203,7 +211,7 @@ class Watchlist(Widget):
 
     def get_selected_ticker(self) -> Optional[str]:
         """Get currently selected ticker"""
-        option_list = self.query_one("#ticker_list", OptionList)
+        option_list = self._option_list
         if option_list.highlighted is not None and self.items:
             idx = option_list.highlighted
             if 0 <= idx < len(self.items):
@@ -232,7 +240,7 @@ class Watchlist(Widget):
 
     def get_selected_item(self) -> Optional[WatchlistItem]:
         """Get currently selected watchlist item"""
-        option_list = self.query_one("#ticker_list", OptionList)
+        option_list = self._option_list
         if option_list.highlighted is not None and self.items:
             idx = option_list.highlighted
             if 0 <= idx < len(self.items):
@@ -294,13 +302,20 @@ class Watchlist(Widget):
 
     def calculate_range_changes(self) -> None:
         """Calculate price changes over the selected day range"""
+        # Same items, range, prices and day as last pass: results are unchanged
+        # (the UTC day matters because price windows are calendar-day based)
+        key = (self.day_range, self.db.version, utc_today())
+        if key == self._range_changes_key:
+            return
+        self._range_changes_key = key
+
         for item in self.items:
-            # Fetch prices for the range
-            prices = self.db.get_daily_prices(item.ticker, self.day_range)
+            # Fetch closes for the range (columns only, no DailyPrice objects)
+            _, closes = self.db.get_daily_closes(item.ticker, self.day_range)
 
-            if prices and len(prices) >= 2:
-                start_price = prices[0].close
-                end_price = prices[-1].close
+            if len(closes) >= 2:
+                start_price = closes[0]
+                end_price = closes[-1]
 
                 item.range_start_price = start_price
                 item.range_change = end_price - start_price
@@ -315,17 +330,25 @@ class Watchlist(Widget):
 
     def calculate_scores(self) -> None:
         """Calculate Iceberg scores for all watchlist items"""
-        from ..analysis.scoring import calculate_trade_score, calculate_investment_score
+        # Scores depend only on each ticker's prices (over a calendar-day
+        # window); skip if none changed today
+        key = (self.db.version, utc_today())
+        if key == self._scores_key:
+            return
+        self._scores_key = key
+
+        from ..analysis.scoring import ScoreInputs, calculate_scores
         from ..analysis.indicators import (
             compute_macd,
             compute_rsi,
-            compute_sma,
+            compute_smas,
             compute_trend,
             compute_volatility,
             compute_distance_from_high,
             count_recovery_patterns,
             compute_long_term_trend,
             find_support_resistance,
+            compute_trend_slope,
         )
 
         for item in self.items:
@@ -337,58 +360,38 @@ class Watchlist(Widget):
                 current_price = closes[-1]
                 macd = compute_macd(closes)
                 rsi = compute_rsi(closes, 14)
-                sma10 = compute_sma(closes, 10)
-                sma20 = compute_sma(closes, 20)
-                sma50 = compute_sma(closes, 50)
-                sma100 = compute_sma(closes, 100)
-                trend10 = compute_trend(closes, 10)
-                trend50 = compute_trend(closes, 50)
-                long_term_trend = compute_long_term_trend(closes, 100)
+                sma10, sma20, sma50, sma100 = compute_smas(closes, (10, 20, 50, 100))
+                trend10 = compute_trend(closes, 10, sma10)
+                trend50 = compute_trend(closes, 50, sma50)
+                long_term_trend = compute_long_term_trend(closes, 100, sma100)
                 volatility = compute_volatility(closes)
+                # Shared by both scores rather than recomputed inside each
+                trend_slope = compute_trend_slope(closes, 100) if len(closes) >= 100 else None
                 distance_from_high = compute_distance_from_high(closes, 20)
                 resilience_count = count_recovery_patterns(closes, 180)
                 support, resistance = find_support_resistance(closes, window=5)
 
                 # Calculate both scores with all indicators
-                trade_result = calculate_trade_score(
+                inputs = ScoreInputs.from_indicators(
                     current_price=current_price,
-                    macd_bias=macd.bias if macd else None,
-                    macd_hist=macd.hist if macd else None,
-                    rsi_value=rsi.value if rsi else None,
-                    rsi_bias=rsi.bias if rsi else None,
+                    macd=macd,
+                    rsi=rsi,
                     sma10=sma10,
                     sma20=sma20,
                     sma50=sma50,
                     sma100=sma100,
-                    trend10_bias=trend10.bias if trend10 else None,
-                    trend50_bias=trend50.bias if trend50 else None,
+                    trend10=trend10,
+                    trend50=trend50,
                     long_term_trend=long_term_trend,
-                    volatility_bias=volatility.bias if volatility else None,
+                    volatility=volatility,
                     distance_from_high=distance_from_high,
                     resilience_count=resilience_count,
                     closes=closes,
                     support=support,
-                    resistance=resistance
-                )
-
-                inv_result = calculate_investment_score(
-                    current_price=current_price,
-                    macd_bias=macd.bias if macd else None,
-                    macd_hist=macd.hist if macd else None,
-                    rsi_value=rsi.value if rsi else None,
-                    rsi_bias=rsi.bias if rsi else None,
-                    sma10=sma10,
-                    sma20=sma20,
-                    sma50=sma50,
-                    sma100=sma100,
-                    trend10_bias=trend10.bias if trend10 else None,
-                    trend50_bias=trend50.bias if trend50 else None,
-                    long_term_trend=long_term_trend,
-                    volatility_bias=volatility.bias if volatility else None,
-                    distance_from_high=distance_from_high,
-                    resilience_count=resilience_count,
-                    closes=closes
+                    resistance=resistance,
+                    trend_slope=trend_slope
                 )
+                trade_result, inv_result = calculate_scores(inputs)
 
                 item.trade_score = trade_result.display_score
                 item.investment_score = inv_result.display_score
@@ -425,15 +428,7 @@ class Watchlist(Widget):
         self._preserved_ticker = self.get_selected_ticker()
 
         # Update prices for all items
-        for item in self.items:
-            # Fetch latest and previous prices for daily change
-            latest = self.db.get_latest_price(item.ticker)
-            if latest:
-                item.current_price = latest.close
-
-            prev_close = self.db.get_previous_close(item.ticker)
-            if prev_close:
-                item.previous_close = prev_close
+        self.apply_latest_prices()
 
         # Recalculate range-based changes
         self.calculate_range_changes()